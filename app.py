@@ -19,7 +19,7 @@ from src.agent.ai_agent import (
     create_analyzer_agent,
     quick_repository_analysis
 )
-from src.servers.server_manager import get_servers_status, start_mcp_servers
+from src.servers.server_manager import get_servers_status, start_mcp_servers, SERVER_ICONS
 from src.utils.config import (
     get_ui_settings, 
     save_ui_settings, 
@@ -50,23 +50,14 @@ def display_tools_used(tools_used):
     # Group tools by server
     server_tools = {}
     for tool in tools_used:
-        if '.' in tool:
-            server, tool_name = tool.split('.', 1)
-            server_tools.setdefault(server, []).append(tool_name)
-        else:
-            server_tools.setdefault('unknown', []).append(tool)
+        server, sep, tool_name = tool.partition('.')
+        if not sep:
+            server, tool_name = 'unknown', tool
+        server_tools.setdefault(server, []).append(tool_name)
     
     # Display grouped by server
-    server_icons = {
-        'file_content': '📄',
-        'repository_structure': '📁', 
-        'commit_history': '📝',
-        'code_search': '🔍',
-        'unknown': '❓'
-    }
-    
     for server, tools in server_tools.items():
-        icon = server_icons.get(server, '🔧')
+        icon = SERVER_ICONS.get(server, '🔧')
         server_name = server.replace('_', ' ').title()
         st.markdown(f"**{icon} {server_name} Server:**")
         for tool in tools:
@@ -299,12 +290,7 @@ st.markdown("#### 📊 MCP Server Status & Utilization")
 server_cols = st.columns(len(server_status['servers']))
 for i, (server_name, server_info) in enumerate(server_status['servers'].items()):
     with server_cols[i]:
-        server_icon = {
-            'file_content': '📄',
-            'repository_structure': '📁',
-            'commit_history': '📝',
-            'code_search': '🔍'
-        }.get(server_name, '🖥️')
+        server_icon = SERVER_ICONS.get(server_name, '🖥️')
         
         status_icon = "✅" if server_info['running'] else "❌"
         status_color = "#10b981" if server_info['running'] else "#ef4444"
@@ -8,6 +8,7 @@ import json
 import asyncio
 import concurrent.futures
 import time
+from collections import defaultdict
 from typing import Dict, List, Any, Optional, Tuple
 from agno.agent import Agent
 from agno.models.groq import Groq
@@ -138,10 +139,8 @@ class FastMCPTools:
         results = {}
         
         # Group tools by server for better connection reuse
-        server_groups = {}
+        server_groups = defaultdict(list)
         for server_name, tool_name, kwargs in tool_calls:
-            if server_name not in server_groups:
-                server_groups[server_name] = []
             server_groups[server_name].append((tool_name, kwargs))
         
         # Execute each server's tools in parallel with increased workers
@@ -35,14 +35,15 @@ class AnalysisEngine:
         return self.agent
     
     def analyze_repository(self, repo_url: str, analysis_type: str = "comprehensive", 
-                          preset: str = "standard", status_callback: Callable = None) -> Dict[str, Any]:
+                          preset: str = "standard", status_callback: Callable = None,
+                          options: Optional[Dict[str, bool]] = None) -> Dict[str, Any]:
         """Perform comprehensive repository analysis"""
         
         if status_callback:
             status_callback("🚀 Starting comprehensive repository analysis...")
         
-        # Get analysis preset
-        preset_config = self.presets.get(preset, self.presets["standard"])
+        # Get analysis preset; explicit options (e.g. include_security) override it
+        preset_config = {**self.presets.get(preset, self.presets["standard"]), **(options or {})}
         
         # Initialize results
         results = {
@@ -58,51 +59,41 @@ class AnalysisEngine:
         start_time = time.time()
         
         try:
-            # 1. Basic Repository Information
-            if status_callback:
-                status_callback("📋 Gathering repository information...")
-            
-            repo_info = self._get_repository_info(repo_url)
-            results["sections"]["repository_info"] = repo_info
-            
-            # 2. File Structure Analysis
-            if status_callback:
-                status_callback("📁 Analyzing file structure...")
-            
-            structure_analysis = self._analyze_file_structure(repo_url, preset_config)
-            results["sections"]["file_structure"] = structure_analysis
-            
-            # 3. Code Analysis
+            # 1-6. The data gathering steps are independent and I/O-bound, so run them in parallel;
+            # each carries the status reported when it completes
+            steps = [
+                ("repository_info", "📋 Repository information gathered", self._get_repository_info, (repo_url,)),
+                ("file_structure", "📁 File structure analyzed", self._analyze_file_structure, (repo_url, preset_config))
+            ]
             if preset_config.get("include_metrics", True):
-                if status_callback:
-                    status_callback("🔍 Analyzing code metrics...")
-                
-                code_analysis = self._analyze_code_metrics(repo_url, preset_config)
-                results["sections"]["code_metrics"] = code_analysis
-            
-            # 4. Dependency Analysis
+                steps.append(("code_metrics", "🔍 Code metrics analyzed", self._analyze_code_metrics, (repo_url, preset_config)))
             if preset_config.get("include_dependencies", True):
-                if status_callback:
-                    status_callback("📦 Analyzing dependencies...")
-                
-                dependency_analysis = self._analyze_dependencies(repo_url)
-                results["sections"]["dependencies"] = dependency_analysis
-            
-            # 5. Commit History Analysis
+                steps.append(("dependencies", "📦 Dependencies analyzed", self._analyze_dependencies, (repo_url,)))
             if preset_config.get("include_commits", True):
-                if status_callback:
-                    status_callback("📝 Analyzing commit history...")
-                
-                commit_analysis = self._analyze_commit_history(repo_url, preset_config)
-                results["sections"]["commit_history"] = commit_analysis
-            
-            # 6. Security Analysis
+                steps.append(("commit_history", "📝 Commit history analyzed", self._analyze_commit_history, (repo_url, preset_config)))
             if preset_config.get("include_security", True):
+                steps.append(("security", "🔒 Security analysis done", self._analyze_security, (repo_url,)))
+            
+            step_results = {}
+            import concurrent.futures
+            with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+                future_to_step = {executor.submit(func, *args): (key, message) for key, message, func, args in steps}
                 if status_callback:
-                    status_callback("🔒 Performing security analysis...")
+                    status_callback(f"📊 Running {len(steps)} analysis steps in parallel...")
                 
-                security_analysis = self._analyze_security(repo_url)
-                results["sections"]["security"] = security_analysis
+                # Report each step as it finishes, so progress moves while the others still run
+                for done, future in enumerate(concurrent.futures.as_completed(future_to_step), 1):
+                    key, message = future_to_step[future]
+                    try:
+                        step_results[key] = future.result()
+                    except Exception as e:
+                        step_results[key] = {"error": str(e)}
+                    if status_callback:
+                        status_callback(f"{message} ({done}/{len(steps)})")
+            
+            # Keep sections in step order regardless of completion order
+            for key, _, _, _ in steps:
+                results["sections"][key] = step_results[key]
             
             # 7. AI-Powered Summary
             if status_callback:
@@ -1214,10 +1205,11 @@ def get_analysis_engine() -> AnalysisEngine:
     return _analysis_engine
 
 def analyze_repository(repo_url: str, analysis_type: str = "comprehensive", 
-                      preset: str = "standard", status_callback: Callable = None) -> Dict[str, Any]:
+                      preset: str = "standard", status_callback: Callable = None,
+                      options: Optional[Dict[str, bool]] = None) -> Dict[str, Any]:
     """Analyze repository using the analysis engine"""
     engine = get_analysis_engine()
-    return engine.analyze_repository(repo_url, analysis_type, preset, status_callback)
+    return engine.analyze_repository(repo_url, analysis_type, preset, status_callback, options)
 
 def quick_analysis(repo_url: str, status_callback: Callable = None) -> Dict[str, Any]:
     """Perform quick repository analysis"""
@@ -8,13 +8,12 @@ import ast
 import re
 from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
-import plotly.graph_objects as go
-import plotly.express as px
-import pandas as pd
 from datetime import datetime
 
 from ..agent.ai_agent import FastMCPTools
 
+# Plotly is imported inside the chart builders so importing this module stays cheap
+
 class CodeAnalyzer:
     """Comprehensive code analyzer with quality metrics, complexity analysis, and pattern detection"""
     
@@ -336,6 +335,7 @@ class CodeAnalyzer:
     
     def _create_metrics_pie(self, metrics: Dict[str, Any]) -> Dict[str, str]:
         """Create code metrics pie chart"""
+        import plotly.graph_objects as go
         if metrics.get("total_lines", 0) > 0:
             fig = go.Figure(data=[go.Pie(
                 labels=['Code Lines', 'Comment Lines', 'Blank Lines'],
@@ -352,6 +352,7 @@ class CodeAnalyzer:
     
     def _create_complexity_chart(self, complexity: Dict[str, Any]) -> Dict[str, str]:
         """Create complexity distribution chart"""
+        import plotly.express as px
         if complexity.get("cyclomatic_complexity"):
             complexity_values = list(complexity["cyclomatic_complexity"].values())
             if complexity_values:
@@ -365,6 +366,7 @@ class CodeAnalyzer:
     
     def _create_quality_gauge(self, analysis: Dict[str, Any]) -> Dict[str, str]:
         """Create quality score gauge"""
+        import plotly.graph_objects as go
         quality_score = analysis.get("quality_score", 50)
         fig = go.Figure(go.Indicator(
             mode="gauge+number+delta",
@@ -390,6 +392,7 @@ class CodeAnalyzer:
     
     def _create_pattern_chart(self, patterns: Dict[str, Any]) -> Dict[str, str]:
         """Create pattern analysis bar chart"""
+        import plotly.express as px
         pattern_counts = {
             "Design Patterns": len(patterns.get("design_patterns", [])),
             "Anti-Patterns": len(patterns.get("anti_patterns", [])),
@@ -4,16 +4,14 @@ Generates interactive visualizations for repository analysis
 """
 
 import json
-import networkx as nx
-import plotly.graph_objects as go
-import plotly.express as px
-import plotly.subplots as sp
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 import re
 
 from ..agent.ai_agent import FastMCPTools
 
+# Plotly and networkx are imported inside the chart builders so importing this module stays cheap
+
 class RepositoryVisualizer:
     """Interactive repository visualization generator"""
     
@@ -95,6 +93,7 @@ class RepositoryVisualizer:
     
     def _create_directory_tree_viz(self, repo_url: str) -> Dict[str, Any]:
         """Create interactive directory tree visualization"""
+        import plotly.express as px
         try:
             # Get directory tree from MCP server
             tree_result = self.tools.get_directory_tree(repo_url, max_depth=5)
@@ -127,6 +126,7 @@ class RepositoryVisualizer:
     
     def _create_file_structure_viz(self, repo_url: str) -> Dict[str, Any]:
         """Create file structure visualization"""
+        import plotly.express as px
         try:
             # Get file structure from MCP server
             structure_result = self.tools.get_file_structure(repo_url)
@@ -159,6 +159,8 @@ class RepositoryVisualizer:
     
     def _create_dependency_graph(self, repo_url: str) -> Dict[str, Any]:
         """Create dependency graph visualization"""
+        import networkx as nx
+        import plotly.graph_objects as go
         try:
             # Get dependency information
             dependency_result = self.tools.search_dependencies(repo_url)
@@ -222,6 +224,7 @@ class RepositoryVisualizer:
     
     def _create_activity_heatmap(self, repo_url: str) -> Dict[str, Any]:
         """Create code activity heatmap"""
+        import plotly.express as px
         try:
             # Get commit history
             commits_result = self.tools.get_recent_commits(repo_url, limit=100)
@@ -257,6 +260,7 @@ class RepositoryVisualizer:
     
     def _create_language_distribution(self, repo_url: str) -> Dict[str, Any]:
         """Create programming language distribution chart"""
+        import plotly.express as px
         try:
             # Get file structure to analyze languages
             structure_result = self.tools.get_file_structure(repo_url)
@@ -288,6 +292,7 @@ class RepositoryVisualizer:
     
     def _create_file_size_distribution(self, repo_url: str) -> Dict[str, Any]:
         """Create file size distribution visualization"""
+        import plotly.express as px
         try:
             # Get file structure
             structure_result = self.tools.get_file_structure(repo_url)
@@ -4,6 +4,7 @@ Advanced code search and analysis with AST/CST parsing
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import re
 import ast
 import json
@@ -250,13 +251,22 @@ def parse_repo_url(repo_url: str) -> tuple[str, str]:
     else:
         raise ValueError("Invalid GitHub URL")
 
+# Shared session so GitHub API calls reuse keep-alive connections
+github_session = requests.Session()
+github_session.headers.update({"Accept": "application/vnd.github.v3+json"})
+github_session.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=8))
+
 def make_github_request(endpoint: str) -> Dict[str, Any]:
     """Make a GitHub API request with proper headers"""
-    headers = {"Accept": "application/vnd.github.v3+json"}
-    response = requests.get(f"https://api.github.com{endpoint}", headers=headers)
+    response = github_session.get(f"https://api.github.com{endpoint}")
     response.raise_for_status()
     return response.json()
 
+@mcp.tool
+def ping() -> Dict[str, Any]:
+    """Lightweight health check that does no GitHub work"""
+    return {"ok": True, "server": "code_search"}
+
 @mcp.tool
 async def search_code(repo_url: str, query: str, ctx: Context, language: str = "") -> Dict[str, Any]:
     """Search for code patterns in repository"""
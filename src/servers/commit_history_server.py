@@ -4,6 +4,7 @@ Simple and effective commit history analysis
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
 from fastmcp import FastMCP, Context
@@ -21,13 +22,22 @@ def parse_repo_url(repo_url: str) -> tuple[str, str]:
     else:
         raise ValueError("Invalid GitHub URL")
 
+# Shared session so GitHub API calls reuse keep-alive connections
+github_session = requests.Session()
+github_session.headers.update({"Accept": "application/vnd.github.v3+json"})
+github_session.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=8))
+
 def make_github_request(endpoint: str) -> Dict[str, Any]:
     """Make a GitHub API request with proper headers"""
-    headers = {"Accept": "application/vnd.github.v3+json"}
-    response = requests.get(f"https://api.github.com{endpoint}", headers=headers)
+    response = github_session.get(f"https://api.github.com{endpoint}")
     response.raise_for_status()
     return response.json()
 
+@mcp.tool
+def ping() -> Dict[str, Any]:
+    """Lightweight health check that does no GitHub work"""
+    return {"ok": True, "server": "commit_history"}
+
 @mcp.tool
 async def get_recent_commits(repo_url: str, ctx: Context, limit: int = 20) -> Dict[str, Any]:
     """Get recent commits from repository with detailed information"""
@@ -4,6 +4,7 @@ File Content Server using FastMCP for content retrieval and analysis from GitHub
 
 import base64
 import requests
+from requests.adapters import HTTPAdapter
 import ast
 import json
 from typing import Dict, Any, List, Optional, Union
@@ -216,13 +217,22 @@ def parse_repo_url(repo_url: str) -> tuple[str, str]:
     else:
         raise ValueError("Invalid GitHub URL")
 
+# Shared session so GitHub API calls reuse keep-alive connections
+github_session = requests.Session()
+github_session.headers.update({"Accept": "application/vnd.github.v3+json"})
+github_session.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=8))
+
 def make_github_request(endpoint: str) -> Dict[str, Any]:
     """Make a GitHub API request with proper headers"""
-    headers = {"Accept": "application/vnd.github.v3+json"}
-    response = requests.get(f"https://api.github.com{endpoint}", headers=headers)
+    response = github_session.get(f"https://api.github.com{endpoint}")
     response.raise_for_status()
     return response.json()
 
+@mcp.tool
+def ping() -> Dict[str, Any]:
+    """Lightweight health check that does no GitHub work"""
+    return {"ok": True, "server": "file_content"}
+
 @mcp.tool
 async def get_file_content(repo_url: str, file_path: str, ctx: Context) -> Dict[str, Any]:
     """Get content of a specific file in a GitHub repository"""
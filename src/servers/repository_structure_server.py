@@ -4,6 +4,7 @@ Advanced repository structure analysis with code parsing
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import ast
 import json
 from typing import Dict, Any, List, Optional, Union
@@ -177,10 +178,14 @@ def parse_repo_url(repo_url: str) -> tuple[str, str]:
     else:
         raise ValueError("Invalid GitHub URL")
 
+# Shared session so GitHub API calls reuse keep-alive connections
+github_session = requests.Session()
+github_session.headers.update({"Accept": "application/vnd.github.v3+json"})
+github_session.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=8))
+
 def make_github_request(endpoint: str) -> Dict[str, Any]:
     """Make a GitHub API request with proper headers"""
-    headers = {"Accept": "application/vnd.github.v3+json"}
-    response = requests.get(f"https://api.github.com{endpoint}", headers=headers)
+    response = github_session.get(f"https://api.github.com{endpoint}")
     response.raise_for_status()
     return response.json()
 
@@ -231,6 +236,11 @@ def build_tree_structure(owner: str, repo: str, path: str = "", max_depth: int =
     except Exception:
         return {"type": "error", "path": path}
 
+@mcp.tool
+def ping() -> Dict[str, Any]:
+    """Lightweight health check that does no GitHub work"""
+    return {"ok": True, "server": "repository_structure"}
+
 @mcp.tool
 async def get_directory_tree(repo_url: str, ctx: Context, max_depth: int = 3) -> Dict[str, Any]:
     """Get a tree structure of the repository directory"""
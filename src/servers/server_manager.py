@@ -3,168 +3,818 @@ Simple Server Manager for FastMCP v2 Servers
 Manages the 4 core MCP servers for repository analysis
 """
 
+import atexit
+import json
+import logging
 import subprocess
+import sys
 import time
 import os
 import signal
-from typing import List, Dict, Any
-from pathlib import Path
+import select
+import selectors
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import List, Dict, Any, Mapping, NamedTuple, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Resolved once so every spawn uses this interpreter without a PATH search
+PYTHON_EXE = sys.executable
+
+# MCP handshake sent over stdio; the server's reply tells us it has finished booting
+_INITIALIZE_REQUEST = (json.dumps({
+    "jsonrpc": "2.0",
+    "id": 0,
+    "method": "initialize",
+    "params": {
+        "protocolVersion": "2024-11-05",
+        "capabilities": {},
+        "clientInfo": {"name": "server-manager", "version": "1.0"}
+    }
+}) + "\n").encode()
+
+class ServerSpec(NamedTuple):
+    """Static description of one MCP server"""
+    key: str
+    name: str
+    description: str
+    script: str
+
+_SERVERS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# The server registry never changes at runtime, so it is built once at import
+SERVER_SPECS: Tuple[ServerSpec, ...] = (
+    ServerSpec(
+        "file_content",
+        "File Content Server 📁",
+        "Retrieve and read file contents from repositories",
+        os.path.join(_SERVERS_DIR, "file_content_server.py")
+    ),
+    ServerSpec(
+        "repository_structure",
+        "Repository Structure Server 🌳",
+        "Get directory trees and file listings",
+        os.path.join(_SERVERS_DIR, "repository_structure_server.py")
+    ),
+    ServerSpec(
+        "commit_history",
+        "Commit History Server 📝",
+        "Access commit messages and changes",
+        os.path.join(_SERVERS_DIR, "commit_history_server.py")
+    ),
+    ServerSpec(
+        "code_search",
+        "Code Search Server 🔍",
+        "Search for specific code patterns or functions",
+        os.path.join(_SERVERS_DIR, "code_search_server.py")
+    ),
+)
+
+# Display icon for each server key; 'unknown' covers tools reported without a server prefix
+SERVER_ICONS: Mapping[str, str] = MappingProxyType({
+    "file_content": "📄",
+    "repository_structure": "📁",
+    "commit_history": "📝",
+    "code_search": "🔍",
+    "unknown": "❓"
+})
+
+def _poll_pidfds(pidfds: List[int]) -> Dict[int, int]:
+    """Return {pidfd: revents} for pidfds that have exited (POLLIN) or are no longer open (POLLNVAL)"""
+    # poll() rather than select(): still one non-blocking syscall, but no FD_SETSIZE
+    # limit, so it keeps working once the process holds more than 1024 descriptors
+    poller = select.poll()
+    for pidfd in pidfds:
+        poller.register(pidfd, select.POLLIN)
+    return dict(poller.poll(0))
 
 class SimpleServerManager:
     """Manages the 4 core FastMCP v2 server processes"""
     
+    __slots__ = (
+        "specs", "servers", "processes", "_pidfds", "_lock", "_script_exists", "_static_status",
+        "_probe_cache", "_probe_ttl", "_status_cache", "_status_cache_ts", "_status_ttl",
+        "_clients", "_client_lock", "_connect_locks", "_loop"
+    )
+    
     def __init__(self):
-        self.servers = {
-            "file_content": {
-                "script": "src/servers/file_content_server.py",
-                "name": "File Content Server 📁",
-                "description": "Retrieve and read file contents from repositories"
-            },
-            "repository_structure": {
-                "script": "src/servers/repository_structure_server.py",
-                "name": "Repository Structure Server 🌳",
-                "description": "Get directory trees and file listings"
-            },
-            "commit_history": {
-                "script": "src/servers/commit_history_server.py",
-                "name": "Commit History Server 📝",
-                "description": "Access commit messages and changes"
-            },
-            "code_search": {
-                "script": "src/servers/code_search_server.py",
-                "name": "Code Search Server 🔍",
-                "description": "Search for specific code patterns or functions"
+        self.specs = SERVER_SPECS
+        self.servers = {spec.key: spec for spec in SERVER_SPECS}
+        self.processes = {}
+        self._pidfds = {}
+        self._lock = threading.RLock()
+        
+        # Server scripts ship with the package, so their presence is checked once
+        self._script_exists = {}
+        self._static_status = {}
+        self.refresh_script_existence()
+        
+        # Short-lived cache for deep health probes: server_name -> (timestamp, result)
+        self._probe_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._probe_ttl = 1.0
+        
+        # Polling UIs ask for status many times a second; keep the last answer briefly
+        self._status_cache = None
+        self._status_cache_ts = 0.0
+        self._status_ttl = 0.25
+        
+        # MCP clients stay connected on one background event loop and are reused across probes
+        self._clients = {}
+        self._client_lock = threading.Lock()
+        # Per-server asyncio locks so only one connect is in flight for each server
+        self._connect_locks = {}
+        self._loop = None
+    
+    def refresh_script_existence(self):
+        """Re-check which server scripts exist on disk (status queries use the cached answer)"""
+        self._script_exists = {
+            spec.key: os.path.exists(spec.script) for spec in self.specs
+        }
+        
+        # The parts of each status entry that only change with the script check
+        self._static_status = {
+            spec.key: {
+                "name": spec.name,
+                "description": spec.description,
+                "script_path": spec.script,
+                "script_exists": self._script_exists[spec.key]
             }
+            for spec in self.specs
         }
-        self.processes = {}
     
-    def start_servers(self, server_names: List[str] = None) -> Dict[str, bool]:
-        """Start specified MCP servers or all servers if none specified"""
-        if server_names is None:
-            server_names = list(self.servers.keys())
+    def _open_pidfd(self, server_name: str, process: subprocess.Popen):
+        """Open a pidfd for the process so liveness checks need no polling (Linux >= 5.3)"""
+        if not hasattr(os, "pidfd_open"):
+            return
+        try:
+            self._pidfds[server_name] = os.pidfd_open(process.pid)
+        except OSError:
+            pass
+    
+    def _close_pidfd(self, server_name: str):
+        """Close the pidfd held for a server, if any"""
+        # Under the lock, so liveness checks never poll a pidfd that is being closed
+        with self._lock:
+            pidfd = self._pidfds.pop(server_name, None)
+            if pidfd is not None:
+                try:
+                    os.close(pidfd)
+                except OSError:
+                    pass
+    
+    def _alive(self, server_name: str) -> Optional[subprocess.Popen]:
+        """Return the server's process if it is still running, without touching the network"""
+        with self._lock:
+            process = self.processes.get(server_name)
+            if process is None:
+                return None
+            
+            pidfd = self._pidfds.get(server_name)
+            if pidfd is not None:
+                # A pidfd becomes readable once the process has exited. A zero-timeout
+                # poll() is a single syscall; os.kill(pid, 0) would be just as cheap but
+                # reports crashed, not-yet-reaped children as alive.
+                revents = _poll_pidfds([pidfd]).get(pidfd, 0)
+                if not revents & select.POLLNVAL:
+                    return None if revents else process
+            
+            return process if process.poll() is None else None
+    
+    def _wait_for_exit(self, server_names: List[str], timeout: float) -> List[str]:
+        """Wait on all given servers with one shared deadline and return the ones that exited"""
+        deadline = time.monotonic() + timeout
+        pending = {}
+        polled = []
+        exited = []
         
-        results = {}
+        for server_name in server_names:
+            pidfd = self._pidfds.get(server_name)
+            if pidfd is not None:
+                pending[pidfd] = server_name
+            else:
+                polled.append(server_name)
+        
+        # Single selector (epoll on Linux) over every pidfd; each becomes readable when
+        # its process exits, so one epoll_wait reaps however many exited meanwhile
+        with selectors.DefaultSelector() as selector:
+            for pidfd, server_name in pending.items():
+                selector.register(pidfd, selectors.EVENT_READ, server_name)
+            
+            while pending:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                for key, _ in selector.select(timeout=remaining):
+                    selector.unregister(key.fd)
+                    pending.pop(key.fd, None)
+                    exited.append(key.data)
+                    # Reap right away and give the pidfd back; it has done its job
+                    self.processes[key.data].wait()
+                    self._close_pidfd(key.data)
+        
+        # Without a pidfd the remaining processes are polled until the same deadline
+        while polled:
+            exited.extend(name for name in polled if self._alive(name) is None)
+            polled = [name for name in polled if name not in exited]
+            remaining = deadline - time.monotonic()
+            if not polled or remaining <= 0:
+                break
+            time.sleep(min(0.05, remaining))
+        
+        return exited
+    
+    def _signal_group(self, process: subprocess.Popen, force: bool = False, server_name: Optional[str] = None):
+        """Send SIGTERM (or SIGKILL when forced) to the server and any helpers it spawned"""
+        # Same guard as Popen.send_signal: once reaped, the pid may belong to an unrelated process
+        if process.poll() is not None:
+            return
+        if not hasattr(os, "killpg"):
+            if force:
+                process.kill()
+            else:
+                process.terminate()
+            return
         
+        sig = signal.SIGKILL if force else signal.SIGTERM
+        pidfd = self._pidfds.get(server_name) if server_name else None
+        try:
+            if pidfd is not None and hasattr(signal, "pidfd_send_signal"):
+                # The pidfd names our child even if something reaps it in the meantime
+                signal.pidfd_send_signal(pidfd, sig)
+            # Servers run in their own session, so the group id equals the pid; the child
+            # was still unreaped above, so that id cannot have been handed to anyone else
+            os.killpg(process.pid, sig)
+        except ProcessLookupError:
+            pass
+    
+    def _send_handshake(self, server_names: List[str]) -> Tuple[List[str], List[str]]:
+        """Write the MCP initialize request to each server; returns (sent, already exited)"""
+        sent = []
+        exited = []
         for server_name in server_names:
-            if server_name not in self.servers:
-                results[server_name] = False
-                print(f"❌ Unknown server: {server_name}")
-                continue
+            process = self.processes[server_name]
+            try:
+                process.stdin.write(_INITIALIZE_REQUEST)
+                process.stdin.flush()
+                sent.append(server_name)
+            except OSError:
+                exited.append(server_name)
+        return sent, exited
+    
+    def _read_handshake(self, server_name: str) -> bool:
+        """Read what the server wrote after the handshake; False means it closed stdout (exited)"""
+        process = self.processes[server_name]
+        return bool(os.read(process.stdout.fileno(), 65536))
+    
+    def _wait_for_ready(self, server_names: List[str], timeout: float) -> List[str]:
+        """Wait until each server answers the MCP handshake, exits, or the deadline passes
+        
+        Returns the servers that exited. Servers still booting at the deadline count as started.
+        """
+        if os.name == "nt":
+            # select() only supports sockets on Windows
+            return self._wait_for_exit(server_names, timeout)
+        
+        deadline = time.monotonic() + timeout
+        pending, exited = self._send_handshake(server_names)
+        
+        with selectors.DefaultSelector() as selector:
+            for server_name in pending:
+                selector.register(self.processes[server_name].stdout, selectors.EVENT_READ, server_name)
             
-            server_info = self.servers[server_name]
-            script_path = server_info["script"]
+            while pending:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                for key, _ in selector.select(timeout=remaining):
+                    selector.unregister(key.fileobj)
+                    pending.remove(key.data)
+                    if not self._read_handshake(key.data):
+                        exited.append(key.data)
+        
+        return exited
+    
+    def _release(self, server_name: str):
+        """Drop all bookkeeping held for a server process"""
+        with self._lock:
+            self._status_cache = None
+            process = self.processes.pop(server_name, None)
+            if process is not None:
+                process.poll()  # Reap the child if it has already exited
+            self._close_pidfd(server_name)
+            self._probe_cache.pop(server_name, None)
+            self._drop_client(server_name)
+    
+    def _get_loop(self):
+        """Get the background event loop that owns the MCP clients, starting it on first use"""
+        import asyncio
+        
+        with self._client_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(target=self._loop.run_forever, name="mcp-client-loop", daemon=True).start()
+            return self._loop
+    
+    def _run(self, coro, timeout: float = None):
+        """Run a coroutine on the background loop and wait for its result"""
+        import asyncio
+        return asyncio.run_coroutine_threadsafe(coro, self._get_loop()).result(timeout)
+    
+    async def _get_client(self, server_name: str):
+        """Get the connected MCP client for a server, connecting on first use (runs on the background loop)"""
+        import asyncio
+        
+        client = self._clients.get(server_name)
+        if client is not None:
+            return client
+        
+        # Concurrent first calls (e.g. from ping_all_servers) wait here and reuse the winner's client
+        async with self._connect_locks.setdefault(server_name, asyncio.Lock()):
+            client = self._clients.get(server_name)
+            if client is None:
+                from fastmcp import Client
+                client = Client(self.servers[server_name].script)
+                await client.__aenter__()
+                with self._client_lock:
+                    existing = self._clients.setdefault(server_name, client)
+                if existing is not client:
+                    # Another connect got in first; close ours so its stdio subprocess does not leak
+                    await client.__aexit__(None, None, None)
+                    client = existing
+        return client
+    
+    def _drop_client(self, server_name: str):
+        """Disconnect and forget the MCP client for a server"""
+        import asyncio
+        
+        with self._client_lock:
+            client = self._clients.pop(server_name, None)
+        if client is not None and self._loop is not None:
+            return asyncio.run_coroutine_threadsafe(client.__aexit__(None, None, None), self._loop)
+        return None
+    
+    def close_clients(self, timeout: float = 2.0):
+        """Disconnect every MCP client and stop the background loop"""
+        if self._loop is None:
+            return
+        
+        pending = [self._drop_client(server_name) for server_name in list(self._clients)]
+        for future in pending:
+            try:
+                future.result(timeout)
+            except Exception:
+                pass
+        
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._loop = None
+        # The locks belong to the stopped loop; a new loop gets fresh ones
+        self._connect_locks.clear()
+    
+    def check_server(self, server_name: str) -> bool:
+        """Cheap liveness check for a single server"""
+        return self._alive(server_name) is not None
+    
+    def probe_server(self, server_name: str) -> Dict[str, Any]:
+        """Deep health check that opens an MCP connection to the server"""
+        # No point paying for an MCP round trip when the process is known to be gone
+        if self._alive(server_name) is None:
+            return {"error": "Server process is not running", "success": False}
+        
+        cached = self._probe_cache.get(server_name)
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < self._probe_ttl:
+            return cached[1]
+        
+        result = self._run(_ping(self, server_name))
+        self._probe_cache[server_name] = (now, result)
+        return result
+    
+    def _launch(self, script_path: str) -> subprocess.Popen:
+        """Start one MCP server process"""
+        # stdout is only read for the reply to the readiness handshake, and stderr
+        # is discarded rather than left to fill a pipe and block the server; stdin
+        # stays open because stdio servers exit on EOF. Pipes are binary and
+        # block-buffered: the handshake is one write and one raw read.
+        # No preexec_fn/uid/gid: that keeps CPython on its vfork() path, so spawning
+        # from a large parent does not copy its page tables. (posix_spawn itself is
+        # ruled out by close_fds and start_new_session, which we need.)
+        return subprocess.Popen(
+            [PYTHON_EXE, script_path],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            stdin=subprocess.PIPE,
+            bufsize=-1,
+            close_fds=True,
+            start_new_session=True
+        )
+    
+    def _spawn_servers(self, server_names: List[str]) -> Tuple[Dict[str, bool], Dict[str, str]]:
+        """Launch server processes without waiting; returns early results and the newly started servers"""
+        servers = self.servers
+        script_exists = self._script_exists
+        results = {}
+        started = {}  # server_name -> display name
+        
+        with self._lock:
+            to_launch = []
+            for server_name in server_names:
+                spec = servers.get(server_name)
+                if spec is None:
+                    results[server_name] = False
+                    logger.error("Unknown server: %s", server_name)
+                    continue
+                
+                if not script_exists[server_name]:
+                    results[server_name] = False
+                    logger.error("Server script not found: %s", spec.script)
+                    continue
+                
+                # Reuse a server that is still running instead of paying for a fresh interpreter
+                if self._alive(server_name) is not None:
+                    results[server_name] = True
+                    continue
+                if server_name in self.processes:
+                    self._release(server_name)
+                
+                to_launch.append(server_name)
             
-            if not os.path.exists(script_path):
-                results[server_name] = False
-                print(f"❌ Server script not found: {script_path}")
-                continue
+            if not to_launch:
+                return results, started
             
-            try:
-                # Start the MCP server process
-                process = subprocess.Popen(
-                    ["python", script_path],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    stdin=subprocess.PIPE,
-                    text=True,
-                    bufsize=1,
-                    universal_newlines=True
-                )
+            # fork/exec releases the GIL, so the launches overlap across threads
+            def launch(server_name):
+                try:
+                    return self._launch(servers[server_name].script)
+                except Exception as e:
+                    return e
+            
+            with ThreadPoolExecutor(max_workers=len(to_launch)) as executor:
+                launched = list(executor.map(launch, to_launch))
+            
+            for server_name, process in zip(to_launch, launched):
+                display_name = servers[server_name].name
+                if isinstance(process, Exception):
+                    results[server_name] = False
+                    logger.error("Error starting %s: %s", display_name, process)
+                    continue
                 
                 self.processes[server_name] = process
-                results[server_name] = True
-                print(f"✅ Started {server_info['name']}")
-                
-            except Exception as e:
-                results[server_name] = False
-                print(f"❌ Error starting {server_info['name']}: {e}")
+                self._open_pidfd(server_name, process)
+                started[server_name] = display_name
+            
+            self._status_cache = None
         
-        # Wait for servers to start
-        time.sleep(2)
+        return results, started
+    
+    def _drain_stdout(self, server_name: str, process: subprocess.Popen):
+        """Keep reading a started server's stdout so it can never block on a full pipe"""
+        def drain():
+            fd = process.stdout.fileno()
+            try:
+                while True:
+                    chunk = os.read(fd, 8192)
+                    if not chunk:
+                        break
+                    logger.debug("[%s] %s", server_name, chunk.decode(errors="replace").rstrip())
+            except OSError:
+                pass
         
-        return results
+        threading.Thread(target=drain, name=f"{server_name}-stdout", daemon=True).start()
     
-    def stop_servers(self, server_names: List[str] = None) -> Dict[str, bool]:
-        """Stop specified MCP servers or all servers if none specified"""
-        if server_names is None:
-            server_names = list(self.processes.keys())
+    def _finish_start(self, results: Dict[str, bool], started: Dict[str, str], exited: List[str]) -> Dict[str, bool]:
+        """Record startup results; a process that exited during startup has failed"""
+        exited = set(exited)
+        for server_name, display_name in started.items():
+            if server_name in exited:
+                results[server_name] = False
+                logger.error("%s exited during startup", display_name)
+                self._release(server_name)
+            else:
+                results[server_name] = True
+                logger.info("Started %s", display_name)
+                self._drain_stdout(server_name, self.processes[server_name])
         
+        return results
+    
+    def _signal_servers(self, server_names: List[str]) -> Tuple[Dict[str, bool], Dict[str, Tuple[subprocess.Popen, str]]]:
+        """Send SIGTERM to every server first so they all shut down concurrently"""
+        servers = self.servers
+        processes = self.processes
         results = {}
+        stopping = {}  # server_name -> (process, display name)
         
         for server_name in server_names:
-            if server_name not in self.processes:
+            process = processes.get(server_name)
+            if process is None:
                 results[server_name] = True  # Already stopped
                 continue
             
-            process = self.processes[server_name]
-            server_info = self.servers[server_name]
-            
+            display_name = servers[server_name].name
             try:
-                # Try graceful shutdown first
-                process.terminate()
-                process.wait(timeout=5)
-                results[server_name] = True
-                print(f"✅ Stopped {server_info['name']}")
-                
-            except subprocess.TimeoutExpired:
-                # Force kill if graceful shutdown fails
-                process.kill()
-                process.wait()
+                self._signal_group(process, server_name=server_name)
+                stopping[server_name] = (process, display_name)
+            except Exception as e:
+                results[server_name] = False
+                logger.error("Error stopping %s: %s", display_name, e)
+                self._release(server_name)
+        
+        return results, stopping
+    
+    def _finish_stop(self, results: Dict[str, bool], stopping: Dict[str, Tuple[subprocess.Popen, str]],
+                     exited: List[str]) -> Dict[str, bool]:
+        """Reap stopped servers and force kill the ones that outlived the grace period"""
+        exited = set(exited)
+        
+        # Force kill every survivor first, then give them all one shared second to die
+        killed = {}
+        for server_name, (process, display_name) in stopping.items():
+            if server_name in exited:
+                continue
+            try:
+                self._signal_group(process, force=True, server_name=server_name)
+                killed[server_name] = process
+            except Exception as e:
+                results[server_name] = False
+                logger.error("Error stopping %s: %s", display_name, e)
+        if killed:
+            self._wait_for_exit(list(killed), 1)
+        
+        for server_name, (process, display_name) in stopping.items():
+            if server_name not in exited and server_name not in killed:
+                self._release(server_name)
+                continue
+            try:
+                process.wait(timeout=0 if server_name in killed else None)
+                if server_name in killed:
+                    logger.warning("Force killed %s", display_name)
+                else:
+                    logger.info("Stopped %s", display_name)
                 results[server_name] = True
-                print(f"⚠️ Force killed {server_info['name']}")
                 
             except Exception as e:
                 results[server_name] = False
-                print(f"❌ Error stopping {server_info['name']}: {e}")
+                logger.error("Error stopping %s: %s", display_name, e)
             
             finally:
-                self.processes[server_name] = None
+                self._release(server_name)
         
         return results
     
-    def get_server_status(self) -> Dict[str, Any]:
-        """Get status of all servers"""
+    def start_servers(self, server_names: List[str] = None, startup_timeout: float = 2.0) -> Dict[str, bool]:
+        """Start specified MCP servers or all servers if none specified"""
+        if server_names is None:
+            server_names = [spec.key for spec in self.specs]
+        
+        results, started = self._spawn_servers(server_names)
+        exited = self._wait_for_ready(list(started), startup_timeout) if started else []
+        return self._finish_start(results, started, exited)
+    
+    def stop_servers(self, server_names: List[str] = None, grace_period_ms: int = 1000) -> Dict[str, bool]:
+        """Stop specified MCP servers or all servers if none specified
+        
+        Servers get grace_period_ms to exit after SIGTERM before being killed.
+        """
+        if server_names is None:
+            server_names = list(self.processes.keys())
+        
+        results, stopping = self._signal_servers(server_names)
+        exited = self._wait_for_exit(list(stopping), grace_period_ms / 1000) if stopping else []
+        return self._finish_stop(results, stopping, exited)
+    
+    async def _await_exit(self, server_names: List[str], timeout: float) -> List[str]:
+        """Event-loop version of _wait_for_exit that watches pidfds with add_reader"""
+        import asyncio
+        
+        pidfds = {server_name: self._pidfds.get(server_name) for server_name in server_names}
+        if None in pidfds.values():
+            # No pidfd to watch (or no reader support); wait in a worker thread instead
+            return await asyncio.to_thread(self._wait_for_exit, server_names, timeout)
+        
+        loop = asyncio.get_running_loop()
+        waiters = []
+        
+        def on_exit(pidfd, waiter, server_name):
+            loop.remove_reader(pidfd)
+            if not waiter.done():
+                waiter.set_result(server_name)
+        
+        try:
+            for server_name, pidfd in pidfds.items():
+                waiter = loop.create_future()
+                loop.add_reader(pidfd, on_exit, pidfd, waiter, server_name)
+                waiters.append(waiter)
+            done, _ = await asyncio.wait(waiters, timeout=timeout)
+        finally:
+            for pidfd in pidfds.values():
+                loop.remove_reader(pidfd)
+        
+        return [waiter.result() for waiter in done]
+    
+    async def _await_ready(self, server_names: List[str], timeout: float) -> List[str]:
+        """Event-loop version of _wait_for_ready that watches server stdout with add_reader"""
+        import asyncio
+        
+        if os.name == "nt":
+            return await asyncio.to_thread(self._wait_for_ready, server_names, timeout)
+        
+        loop = asyncio.get_running_loop()
+        pending, exited = self._send_handshake(server_names)
+        waiters = {}
+        
+        def on_reply(fd, waiter, server_name):
+            loop.remove_reader(fd)
+            if not waiter.done():
+                waiter.set_result(self._read_handshake(server_name))
+        
+        try:
+            for server_name in pending:
+                fd = self.processes[server_name].stdout.fileno()
+                waiter = loop.create_future()
+                loop.add_reader(fd, on_reply, fd, waiter, server_name)
+                waiters[waiter] = (fd, server_name)
+            done, _ = await asyncio.wait(waiters, timeout=timeout) if waiters else (set(), set())
+        finally:
+            for fd, _ in waiters.values():
+                loop.remove_reader(fd)
+        
+        exited.extend(waiters[waiter][1] for waiter in done if not waiter.result())
+        return exited
+    
+    async def astart_servers(self, server_names: List[str] = None, startup_timeout: float = 2.0) -> Dict[str, bool]:
+        """Non-blocking start_servers for callers already running an event loop"""
+        if server_names is None:
+            server_names = [spec.key for spec in self.specs]
+        
+        results, started = self._spawn_servers(server_names)
+        exited = await self._await_ready(list(started), startup_timeout) if started else []
+        return self._finish_start(results, started, exited)
+    
+    async def astop_servers(self, server_names: List[str] = None, grace_period_ms: int = 1000) -> Dict[str, bool]:
+        """Non-blocking stop_servers for callers already running an event loop"""
+        if server_names is None:
+            server_names = list(self.processes.keys())
+        
+        results, stopping = self._signal_servers(server_names)
+        exited = await self._await_exit(list(stopping), grace_period_ms / 1000) if stopping else []
+        return self._finish_stop(results, stopping, exited)
+    
+    def _alive_servers(self) -> set:
+        """Liveness of every managed server from a single poll() over all pidfds"""
+        alive = set()
+        by_pidfd = {}
+        
+        # Other sessions start, stop and restart servers concurrently; hold the lock so
+        # the dicts cannot change and no pidfd is closed (and its number reused) mid-check
+        with self._lock:
+            for server_name, process in self.processes.items():
+                if process is None:
+                    continue
+                pidfd = self._pidfds.get(server_name)
+                if pidfd is None:
+                    if process.poll() is None:
+                        alive.add(server_name)
+                else:
+                    by_pidfd[pidfd] = (server_name, process)
+            
+            if by_pidfd:
+                events = _poll_pidfds(list(by_pidfd))
+                for pidfd, (server_name, process) in by_pidfd.items():
+                    revents = events.get(pidfd, 0)
+                    if revents & select.POLLNVAL:
+                        # The pidfd is no longer open; fall back to the process handle
+                        if process.poll() is None:
+                            alive.add(server_name)
+                    elif not revents:
+                        alive.add(server_name)
+        
+        return alive
+    
+    def get_server_info(self, server_name: str, is_running: bool = None) -> Dict[str, Any]:
+        """Get the status entry for a single known server"""
+        if is_running is None:
+            process = self._alive(server_name)
+            is_running = process is not None
+        else:
+            process = self.processes.get(server_name) if is_running else None
+        
+        return {
+            **self._static_status[server_name],
+            "running": is_running,
+            "process_id": process.pid if process else None
+        }
+    
+    def get_server_status(self, deep: bool = False) -> Dict[str, Any]:
+        """Get status of all servers
+        
+        With deep=True every running server is also pinged over MCP, concurrently.
+        """
+        now = time.monotonic()
+        if not deep and self._status_cache is not None and now - self._status_cache_ts < self._status_ttl:
+            return self._status_cache
+        
+        alive = self._alive_servers()
+        servers = {spec.key: self.get_server_info(spec.key, spec.key in alive) for spec in self.specs}
+        running = sum(entry["running"] for entry in servers.values())
+        
         status = {
-            "servers": {},
-            "total_servers": len(self.servers),
-            "running_servers": 0,
-            "stopped_servers": 0
+            "servers": servers,
+            "total_servers": len(self.specs),
+            "running_servers": running,
+            "stopped_servers": len(self.specs) - running
         }
         
-        for server_name, server_info in self.servers.items():
-            is_running = server_name in self.processes and self.processes[server_name] is not None
-            if is_running:
-                status["running_servers"] += 1
-            else:
-                status["stopped_servers"] += 1
+        if not deep:
+            self._status_cache = status
+            self._status_cache_ts = now
+        elif alive:
+            import asyncio
             
-            status["servers"][server_name] = {
-                "name": server_info["name"],
-                "description": server_info["description"],
-                "script_path": server_info["script"],
-                "script_exists": os.path.exists(server_info["script"]),
-                "running": is_running,
-                "process_id": self.processes[server_name].pid if is_running else None
-            }
+            names = list(alive)
+            
+            async def ping_running():
+                return await asyncio.gather(*(_ping(self, name) for name in names))
+            
+            for server_name, result in zip(names, self._run(ping_running())):
+                status["servers"][server_name]["healthy"] = result.get("success", False)
         
         return status
     
-    def restart_servers(self, server_names: List[str] = None) -> Dict[str, bool]:
-        """Restart specified servers or all servers if none specified"""
-        if server_names is None:
-            server_names = list(self.servers.keys())
+    def _detach(self, server_names: List[str]) -> Dict[str, subprocess.Popen]:
+        """Take running processes out of the manager so replacements can be started next to them"""
+        detached = {}
+        with self._lock:
+            for server_name in server_names:
+                process = self.processes.pop(server_name, None)
+                self._close_pidfd(server_name)
+                self._probe_cache.pop(server_name, None)
+                self._drop_client(server_name)
+                if process is not None:
+                    detached[server_name] = process
+            self._status_cache = None
+        return detached
+    
+    def _retire(self, detached: Dict[str, subprocess.Popen], grace_period_ms: int) -> Dict[str, bool]:
+        """Stop processes that are no longer tracked, sharing one grace period between them"""
+        results = {}
+        for server_name, process in detached.items():
+            try:
+                self._signal_group(process)
+            except Exception as e:
+                results[server_name] = False
+                logger.error("Error stopping old %s: %s", self.servers[server_name].name, e)
+        
+        deadline = time.monotonic() + grace_period_ms / 1000
+        pending = [name for name in detached if name not in results]
+        while pending and time.monotonic() < deadline:
+            pending = [name for name in pending if detached[name].poll() is None]
+            if pending:
+                time.sleep(0.02)
+        
+        for server_name in detached:
+            if server_name in results:
+                continue
+            process = detached[server_name]
+            try:
+                if server_name in pending:
+                    self._signal_group(process, force=True)
+                    logger.warning("Force killed old %s", self.servers[server_name].name)
+                process.wait(timeout=1)
+                results[server_name] = True
+            except Exception as e:
+                results[server_name] = False
+                logger.error("Error stopping old %s: %s", self.servers[server_name].name, e)
         
-        print("🔄 Restarting servers...")
+        return results
+    
+    def restart_servers(self, server_names: List[str] = None, grace_period_ms: int = 1000) -> Dict[str, bool]:
+        """Restart specified servers or all servers if none specified
         
-        # Stop servers
-        stop_results = self.stop_servers(server_names)
+        This is a rolling restart: new instances are started and confirmed ready while
+        the old ones keep running, and only then are the old ones stopped. A server
+        whose replacement fails to start keeps its old instance.
+        """
+        if server_names is None:
+            server_names = [spec.key for spec in self.specs]
         
-        # Wait a moment
-        time.sleep(1)
+        logger.info("Restarting servers: %s", ", ".join(server_names))
         
-        # Start servers
+        detached = self._detach(server_names)
         start_results = self.start_servers(server_names)
         
+        # Put back old instances whose replacement failed, retire the rest
+        with self._lock:
+            for server_name in list(detached):
+                process = detached[server_name]
+                if not start_results.get(server_name) and process.poll() is None:
+                    del detached[server_name]
+                    self.processes[server_name] = process
+                    self._open_pidfd(server_name, process)
+                    self._status_cache = None
+                    logger.warning("Keeping old %s running", self.servers[server_name].name)
+        stop_results = self._retire(detached, grace_period_ms)
+        
         # Combine results
         results = {}
         for server_name in server_names:
@@ -172,25 +822,61 @@ class SimpleServerManager:
         
         return results
 
-# Global server manager instance
+def _install_shutdown_hooks(manager: SimpleServerManager):
+    """Make sure child servers are stopped when this process exits or is terminated"""
+    atexit.register(manager.stop_servers)
+    atexit.register(manager.close_clients)
+    
+    # Signal handlers can only be installed from the main thread (Streamlit runs
+    # scripts in worker threads); atexit still covers normal interpreter exit there.
+    if threading.current_thread() is not threading.main_thread():
+        return
+    
+    previous_handler = signal.getsignal(signal.SIGTERM)
+    
+    def handle_sigterm(signum, frame):
+        manager.stop_servers()
+        if callable(previous_handler):
+            previous_handler(signum, frame)
+        sys.exit(0)
+    
+    signal.signal(signal.SIGTERM, handle_sigterm)
+
+# Global server manager instance; created once, under a lock so concurrent sessions share it
 _server_manager = None
+_server_manager_lock = threading.Lock()
 
-def get_server_manager() -> SimpleServerManager:
-    """Get the global server manager instance"""
+def get_server_manager(auto_start: bool = False) -> SimpleServerManager:
+    """Get the global server manager instance, optionally making sure its servers are running"""
     global _server_manager
     if _server_manager is None:
-        _server_manager = SimpleServerManager()
-    return _server_manager
+        with _server_manager_lock:
+            if _server_manager is None:
+                manager = SimpleServerManager()
+                _install_shutdown_hooks(manager)
+                _server_manager = manager
+    
+    manager = _server_manager
+    if auto_start:
+        # Under the manager lock so two sessions cannot both launch the same server;
+        # on every rerun after the first this is just a liveness check
+        with manager._lock:
+            alive = manager._alive_servers()
+            missing = [spec.key for spec in manager.specs
+                       if spec.key not in alive and manager._script_exists[spec.key]]
+            if missing:
+                manager.start_servers(missing)
+    return manager
 
 def start_mcp_servers(server_names: List[str] = None) -> Dict[str, bool]:
     """Start MCP servers"""
     manager = get_server_manager()
     return manager.start_servers(server_names)
 
-def stop_mcp_servers(server_names: List[str] = None) -> Dict[str, bool]:
+def stop_mcp_servers(server_names: List[str] = None, grace_period_ms: int = 1000) -> Dict[str, bool]:
     """Stop MCP servers"""
     manager = get_server_manager()
-    return manager.stop_servers(server_names)
+    return manager.stop_servers(server_names, grace_period_ms)
 
 def restart_mcp_servers(server_names: List[str] = None) -> Dict[str, bool]:
     """Restart MCP servers"""
@@ -204,13 +890,10 @@ def get_servers_status() -> Dict[str, Any]:
 
 def check_servers_health() -> Dict[str, bool]:
     """Check if all servers are running properly"""
-    status = get_servers_status()
-    health = {}
-    
-    for server_name, server_info in status["servers"].items():
-        health[server_name] = server_info["running"] and server_info["script_exists"]
-    
-    return health
+    manager = get_server_manager()
+    # One select() over every pidfd plus the cached script checks; no status dict is built
+    alive = manager._alive_servers()
+    return {spec.key: spec.key in alive and manager._script_exists[spec.key] for spec in manager.specs}
 
 def get_server_info(server_name: str) -> Dict[str, Any]:
     """Get detailed information about a specific server"""
@@ -218,66 +901,102 @@ def get_server_info(server_name: str) -> Dict[str, Any]:
     if server_name not in manager.servers:
         return {"error": f"Unknown server: {server_name}"}
     
-    server_info = manager.servers[server_name]
-    is_running = server_name in manager.processes and manager.processes[server_name] is not None
-    
-    return {
-        "name": server_info["name"],
-        "description": server_info["description"],
-        "script_path": server_info["script"],
-        "script_exists": os.path.exists(server_info["script"]),
-        "running": is_running,
-        "process_id": manager.processes[server_name].pid if is_running else None
-    }
+    return manager.get_server_info(server_name)
 
 def list_available_servers() -> List[Dict[str, str]]:
     """List all available servers with their descriptions"""
     manager = get_server_manager()
     servers = []
     
-    for server_name, server_info in manager.servers.items():
+    for spec in manager.specs:
         servers.append({
-            "name": server_name,
-            "display_name": server_info["name"],
-            "description": server_info["description"],
-            "script_path": server_info["script"]
+            "name": spec.key,
+            "display_name": spec.name,
+            "description": spec.description,
+            "script_path": spec.script
         })
     
     return servers
 
+async def _list_tools(manager: SimpleServerManager, server_name: str) -> Dict[str, Any]:
+    """List the tools of one server over its persistent client connection"""
+    if server_name not in manager.servers:
+        return {"error": f"Unknown server: {server_name}", "success": False}
+    if not manager._script_exists[server_name]:
+        return {"error": f"Server script not found: {manager.servers[server_name].script}", "success": False}
+    
+    try:
+        client = await manager._get_client(server_name)
+        tools = await client.list_tools()
+        return {
+            "success": True,
+            "tools_count": len(tools),
+            "tools": [tool.name for tool in tools]
+        }
+    except Exception as e:
+        manager._drop_client(server_name)
+        return {"error": str(e), "success": False}
+
 def test_server_connection(server_name: str) -> Dict[str, Any]:
     """Test connection to a specific server"""
     try:
-        from fastmcp import Client
-        
         manager = get_server_manager()
-        if server_name not in manager.servers:
-            return {"error": f"Unknown server: {server_name}", "success": False}
-        
-        script_path = manager.servers[server_name]["script"]
-        
-        if not os.path.exists(script_path):
-            return {"error": f"Server script not found: {script_path}", "success": False}
-        
-        # Test with a simple client connection
-        async def test_connection():
-            try:
-                async with Client(script_path) as client:
-                    tools = await client.list_tools()
-                    return {
-                        "success": True,
-                        "tools_count": len(tools),
-                        "tools": [tool.name for tool in tools]
-                    }
-            except Exception as e:
-                return {"error": str(e), "success": False}
-        
-        import asyncio
-        return asyncio.run(test_connection())
-        
+        return manager._run(_list_tools(manager, server_name))
     except Exception as e:
         return {"error": f"Connection test failed: {str(e)}", "success": False}
 
+def test_all_server_connections(server_names: List[str] = None) -> Dict[str, Dict[str, Any]]:
+    """Test connections to several servers concurrently on the shared event loop"""
+    import asyncio
+    
+    manager = get_server_manager()
+    if server_names is None:
+        server_names = [spec.key for spec in manager.specs]
+    
+    async def test_all():
+        results = await asyncio.gather(*(_list_tools(manager, name) for name in server_names))
+        return dict(zip(server_names, results))
+    
+    try:
+        return manager._run(test_all())
+    except Exception as e:
+        return {name: {"error": f"Connection test failed: {str(e)}", "success": False} for name in server_names}
+
+async def _ping(manager: SimpleServerManager, server_name: str) -> Dict[str, Any]:
+    """Call the lightweight ping tool on one server"""
+    if server_name not in manager.servers:
+        return {"error": f"Unknown server: {server_name}", "success": False}
+    if not manager._script_exists[server_name]:
+        return {"error": f"Server script not found: {manager.servers[server_name].script}", "success": False}
+    
+    try:
+        client = await manager._get_client(server_name)
+        await client.call_tool("ping", {})
+        return {"success": True}
+    except Exception as e:
+        # Reconnect on the next probe rather than reusing a broken session
+        manager._drop_client(server_name)
+        return {"error": str(e), "success": False}
+
+def ping_server(server_name: str) -> Dict[str, Any]:
+    """Check that a server answers MCP requests without triggering any GitHub work"""
+    manager = get_server_manager()
+    return manager._run(_ping(manager, server_name))
+
+def ping_all_servers(server_names: List[str] = None) -> Dict[str, Dict[str, Any]]:
+    """Ping several servers concurrently on the shared event loop"""
+    import asyncio
+    
+    manager = get_server_manager()
+    if server_names is None:
+        server_names = [spec.key for spec in manager.specs]
+    
+    async def ping_all():
+        results = await asyncio.gather(*(_ping(manager, name) for name in server_names))
+        return dict(zip(server_names, results))
+    
+    return manager._run(ping_all())
+
 # Convenience functions for common operations
 def start_all_servers() -> Dict[str, bool]:
     """Start all 4 core servers"""
@@ -306,7 +1025,7 @@ def get_quick_status() -> str:
 
 if __name__ == "__main__":
     # Simple CLI for testing
-    import sys
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
     
     if len(sys.argv) < 2:
         print("Usage: python server_manager.py [start|stop|restart|status|health]")
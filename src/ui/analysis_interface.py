@@ -4,13 +4,14 @@ Provides systematic repository analysis with progress tracking, tool explanation
 """
 
 import streamlit as st
+import functools
 import json
+import logging
+import re
+import threading
 import time
-from datetime import datetime
-from typing import Dict, Any, Optional, Callable
-import plotly.express as px
-import plotly.graph_objects as go
-import pandas as pd
+from collections import OrderedDict, defaultdict
+from typing import Dict, Any, List, Optional, Callable, Sequence, Tuple
 
 from ..analysis.analysis_engine import (
     analyze_repository,
@@ -22,10 +23,285 @@ from ..analysis.analysis_engine import (
     ultra_fast_summarization,
     comprehensive_smart_summarization
 )
-from ..utils.config import get_analysis_presets, get_analysis_settings
+from ..utils.config import get_analysis_presets
 from ..utils.repository_manager import get_repository_manager, get_analysis_history
-from ..utils.performance_monitor import get_performance_monitor, AnalysisType, AnalysisStage
-from ..servers.server_manager import get_servers_status
+from ..utils.performance_monitor import get_performance_monitor, PerformanceMonitor, AnalysisType, AnalysisStage
+from ..servers.server_manager import get_servers_status, SERVER_ICONS
+
+logger = logging.getLogger(__name__)
+
+# st.fragment is Streamlit >= 1.37 (earlier releases only have the experimental name);
+# without either, fragments fall back to plain functions
+_st_fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None)
+_fragment = _st_fragment or (lambda func: func)
+
+def _polling_fragment(run_every: float) -> Callable:
+    """Fragment that also reruns on its own every run_every seconds, where Streamlit supports it"""
+    return _st_fragment(run_every=run_every) if _st_fragment else (lambda func: func)
+
+# Indicators for each security risk level
+_RISK_ICONS = {"low": "🟢", "medium": "🟡", "high": "🔴"}
+_RISK_COLORS = {"low": "green", "medium": "orange", "high": "red"}
+
+# Analysis type cards: (type, accent color, icon, label)
+_ETA_CARDS = (
+    (AnalysisType.ULTRA_FAST, "#10b981", "⚡", "Ultra Fast"),
+    (AnalysisType.QUICK_OVERVIEW, "#3b82f6", "🚀", "Quick Overview"),
+    (AnalysisType.SMART_SUMMARY, "#f59e0b", "🧠", "Smart Summary"),
+    (AnalysisType.COMPREHENSIVE, "#ef4444", "🔍", "Comprehensive")
+)
+
+# Shared card styling, sent once per page; each card only sets its accent color
+_CARD_CSS = """
+<style>
+.ra-card-row { display: flex; gap: 16px; }
+.ra-card-row > .ra-card { flex: 1; min-width: 0; }
+.ra-card { text-align: center; padding: 15px; border: 2px solid var(--ra-accent); border-radius: 12px; background: linear-gradient(135deg, #1f2937, #111827); box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1); }
+.ra-card-icon { font-size: 24px; margin-bottom: 8px; }
+.ra-card-title { font-weight: bold; margin: 8px 0; color: #f9fafb; font-size: 14px; }
+.ra-card-value { color: var(--ra-accent); font-weight: bold; font-size: 18px; }
+.ra-card-note { color: #9ca3af; font-size: 12px; }
+.ra-server-card .ra-card-icon { font-size: 32px; }
+.ra-server-card .ra-card-title { font-size: 16px; }
+.ra-server-card .ra-card-value { font-size: 14px; background-color: rgba(255, 255, 255, 0.1); padding: 4px 8px; border-radius: 6px; display: inline-block; }
+.ra-server-card .ra-card-note { margin-top: 8px; }
+.ra-metric-row { display: flex; gap: 16px; margin-bottom: 16px; }
+.ra-metric { flex: 1; min-width: 0; }
+.ra-metric-label { font-size: 14px; opacity: 0.7; }
+.ra-metric-value { font-size: 28px; line-height: 1.4; white-space: nowrap; overflow: hidden; text-overflow: ellipsis; }
+.ra-tool { margin: 6px 0; }
+.ra-tool-grid { display: grid; grid-template-columns: 1fr 2fr; gap: 8px 16px; padding: 8px 0 4px 16px; }
+</style>
+"""
+
+_ETA_CARD_TEMPLATE = """<div class="ra-card" style="--ra-accent: {color};">
+    <div class="ra-card-icon">{icon}</div>
+    <div class="ra-card-title">{label}</div>
+    <div class="ra-card-value">{tool_count} tools</div>
+    <div class="ra-card-note">{complexity} complexity</div>
+</div>"""
+
+# A row of cards laid out by CSS, sent as a single markdown element
+_CARD_ROW_TEMPLATE = '<div class="ra-card-row">{cards}</div>'
+
+_SERVER_CARD_TEMPLATE = """<div class="ra-card ra-server-card" style="--ra-accent: {color};">
+    <div class="ra-card-icon">{icon}</div>
+    <div class="ra-card-title">{name}</div>
+    <div class="ra-card-value">{status}</div>
+    <div class="ra-card-note">Utilization: {utilization:.1f}%</div>
+</div>"""
+
+# A tool's explanation as a native <details> element, so the whole server panel is one markdown call
+_TOOL_EXPLANATION_TEMPLATE = """<details class="ra-tool">
+<summary><b>🔧 {name}</b></summary>
+<div class="ra-tool-grid">
+<div><b>Duration:</b> {typical_duration}s<br><b>Complexity:</b> {complexity}<br><b>Server:</b> {server}</div>
+<div><b>What it does:</b> {what_it_does}<br><b>When to use:</b> {when_to_use}</div>
+</div>
+</details>"""
+
+# Stage each tool is credited to, by keywords in its name; the first matching stage wins
+_QUICK_TOOL_STAGES = (
+    (re.compile("readme|file"), AnalysisStage.DATA_GATHERING),
+    (re.compile("code|metrics"), AnalysisStage.CODE_ANALYSIS),
+    (re.compile("summary|ai"), AnalysisStage.AI_SUMMARY)
+)
+_COMPREHENSIVE_TOOL_STAGES = (
+    (re.compile("readme|file|directory"), AnalysisStage.DATA_GATHERING),
+    (re.compile("code|metrics|complexity"), AnalysisStage.CODE_ANALYSIS),
+    (re.compile("security|vulnerability|dependency"), AnalysisStage.SECURITY_SCAN),
+    (re.compile("quality|documentation|testing"), AnalysisStage.QUALITY_ASSESSMENT),
+    (re.compile("summary|ai"), AnalysisStage.AI_SUMMARY)
+)
+_SUMMARY_TOOL_STAGES = (
+    (re.compile("readme|file|directory"), AnalysisStage.DATA_GATHERING),
+    (re.compile("code|metrics|complexity"), AnalysisStage.CODE_ANALYSIS),
+    (re.compile("summary|ai"), AnalysisStage.AI_SUMMARY)
+)
+
+# Backends can report progress far faster than the browser needs to be redrawn
+_PROGRESS_REDRAW_INTERVAL = 0.1
+
+# Markdown headers reused across the result displays
+_HDR_TOOLS_USED = "#### 🔧 Tools Used"
+_HDR_ANALYSIS_TOOLS_USED = "**🔧 Analysis Tools Used:**"
+_HDR_COMPREHENSIVE_SUMMARY = "#### 🧠 AI-Powered Comprehensive Summary"
+_HDR_AI_SUMMARY = "#### 🤖 AI Summary"
+_HDR_CODE_METRICS = "#### 📊 Code Metrics"
+_HDR_CODE_PATTERNS = "#### 🔍 Code Patterns"
+
+# Analysis runners by kind; each takes (repo_url, status_callback)
+_ANALYSIS_RUNNERS = {
+    "quick": quick_analysis,
+    "security": security_analysis,
+    "code_quality": code_quality_analysis,
+    "visualizations": generate_visualizations,
+    "ultra_fast_summary": ultra_fast_summarization,
+    "smart_summary": smart_summarization,
+    "comprehensive_summary": comprehensive_smart_summarization
+}
+
+@st.cache_data(ttl=5, show_spinner=False)
+def _eta_snapshot() -> Dict[AnalysisType, Dict[str, Any]]:
+    """ETA, expected tools and complexity for every analysis type"""
+    performance_monitor = get_performance_monitor()
+    return {analysis_type: performance_monitor.get_analysis_eta(analysis_type) for analysis_type in AnalysisType}
+
+@st.cache_resource(show_spinner=False)
+def _grouped_tool_explanations() -> Dict[str, List[Tuple[str, Dict[str, Any]]]]:
+    """Tool explanations grouped by MCP server; the tool catalogue is fixed for the process"""
+    performance_monitor = get_performance_monitor()
+    server_tools = defaultdict(list)
+    for tool_name in performance_monitor.tools_info:
+        tool_info = performance_monitor.get_tool_explanation(tool_name)
+        if isinstance(tool_info, dict) and 'server' in tool_info:
+            server_tools[tool_info['server']].append((tool_name, tool_info))
+    return dict(server_tools)
+
+@st.cache_resource(show_spinner=False)
+def _tool_explanation_panels() -> List[str]:
+    """One HTML panel per server, with a collapsible entry for each of its tools"""
+    panels = []
+    for server_name, tools in _grouped_tool_explanations().items():
+        server_icon = SERVER_ICONS.get(server_name, '🖥️')
+        parts = [f"<p><b>{server_icon} {server_name.replace('_', ' ').title()} Server</b></p>"]
+        for tool_name, tool_info in tools:
+            if isinstance(tool_info, dict) and 'name' in tool_info:
+                parts.append(_TOOL_EXPLANATION_TEMPLATE.format(**tool_info))
+        panels.append("\n".join(parts))
+    return panels
+
+@st.cache_resource(show_spinner=False)
+def _expected_tools_markdown(analysis_type: AnalysisType) -> str:
+    """Bullet list of the tools an analysis type runs, built once per type"""
+    performance_monitor = get_performance_monitor()
+    lines = []
+    for tool_name in performance_monitor.get_analysis_eta(analysis_type)['expected_tools']:
+        tool_info = performance_monitor.get_tool_explanation(tool_name)
+        if isinstance(tool_info, dict) and 'name' in tool_info:
+            lines.append(f"• **{tool_info['name']}** ({tool_info['typical_duration']}s) - {tool_info['description']}")
+    return "\n\n".join(lines)
+
+# Finished analyses, shared by every session: (kind, repo_url, preset_id, options) -> (stored_at, result).
+# A plain dict rather than st.cache_data, which would record and replay the progress
+# elements the status callback draws while the analysis runs.
+_ANALYSIS_CACHE_TTL = 3600
+_ANALYSIS_CACHE_MAX_ENTRIES = 64
+_analysis_cache: "OrderedDict[Tuple, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+_analysis_cache_lock = threading.Lock()
+
+def run_cached_analysis(kind: str, repo_url: str, status_callback: Callable = None,
+                        preset_id: Optional[str] = None,
+                        options: Optional[Dict[str, bool]] = None) -> Dict[str, Any]:
+    """Run an analysis through the result cache; errors are returned but not cached"""
+    # A sorted tuple keys the same no matter the order the options were collected in
+    options_key = tuple(sorted((options or {}).items()))
+    cache_key = (kind, repo_url, preset_id, options_key)
+    
+    with _analysis_cache_lock:
+        entry = _analysis_cache.get(cache_key)
+        if entry and time.monotonic() - entry[0] < _ANALYSIS_CACHE_TTL:
+            _analysis_cache.move_to_end(cache_key)
+            return entry[1]
+    
+    # Cache miss: run outside the lock so the status callback can draw progress
+    if kind == "comprehensive":
+        result = analyze_repository(repo_url, "comprehensive", preset_id, status_callback, dict(options_key))
+    else:
+        result = _ANALYSIS_RUNNERS[kind](repo_url, status_callback)
+    
+    if isinstance(result, dict) and "error" in result:
+        return {"error": result["error"]}
+    
+    with _analysis_cache_lock:
+        _analysis_cache[cache_key] = (time.monotonic(), result)
+        _analysis_cache.move_to_end(cache_key)
+        while len(_analysis_cache) > _ANALYSIS_CACHE_MAX_ENTRIES:
+            _analysis_cache.popitem(last=False)
+    return result
+
+def _redraw_throttle(interval: float = _PROGRESS_REDRAW_INTERVAL) -> Callable[[Optional[float]], bool]:
+    """Return a check that allows one progress redraw per interval; the first and last updates always pass"""
+    last_redraw = [0.0]
+    
+    def due(progress: Optional[float] = None) -> bool:
+        now = time.monotonic()
+        if progress in (0, 100) or now - last_redraw[0] >= interval:
+            last_redraw[0] = now
+            return True
+        return False
+    
+    return due
+
+def _complete_tool_stage(performance_monitor: PerformanceMonitor, current_tool: str,
+                         stages: Tuple[Tuple[re.Pattern, AnalysisStage], ...]) -> None:
+    """Mark a finished tool complete under the first stage whose keywords appear in its name"""
+    tool_name = current_tool.lower()
+    for pattern, stage in stages:
+        if pattern.search(tool_name):
+            performance_monitor.complete_tool(stage, current_tool)
+            return
+
+def _mark_busy(busy_key: str) -> None:
+    """Button callback; runs before the rerun, so that rerun already draws the button disabled"""
+    st.session_state[busy_key] = True
+
+def _start_button(label: str, result_key: str) -> bool:
+    """Primary start button; True once per click, drawn disabled for the run that click starts"""
+    # Consumed here, so an interrupted run is never restarted without a new click
+    busy = st.session_state.pop(f"busy_{result_key}", False)
+    st.button(label, type="primary", use_container_width=True, disabled=busy,
+              on_click=_mark_busy, args=(f"busy_{result_key}",))
+    return busy
+
+def _render_text_section(header: str, body: Any) -> None:
+    """Show a markdown header and its text as one element; non-text bodies fall back to st.write"""
+    if isinstance(body, str):
+        st.markdown(f"{header}\n\n{body}")
+    else:
+        st.markdown(header)
+        st.write(body)
+
+def _metric_strip(items: List[Tuple[str, Any]]) -> None:
+    """Show (label, value) metrics in one row, as a single markdown element instead of one st.metric each"""
+    tiles = "".join(
+        f'<div class="ra-metric"><div class="ra-metric-label">{label}</div><div class="ra-metric-value">{value}</div></div>'
+        for label, value in items
+    )
+    st.markdown(f'<div class="ra-metric-row">{tiles}</div>', unsafe_allow_html=True)
+
+def _metric_grid(items: List[Tuple[str, Any]], cols: int = 3) -> None:
+    """Lay out (label, value) metrics row by row across a fixed number of columns"""
+    columns = st.columns(cols)
+    for i, (label, value) in enumerate(items):
+        columns[i % cols].metric(label, value)
+
+@_polling_fragment(run_every=5)
+def _render_server_status() -> None:
+    """Render the MCP server status cards; refreshes itself without rerunning the page"""
+    st.markdown("#### 🔧 MCP Server Status & Utilization")
+    server_status = get_servers_status()
+    server_utilization = get_performance_monitor().get_server_status()
+    cards = []
+    
+    for server_name, server_info in server_status['servers'].items():
+        server_icon = SERVER_ICONS.get(server_name, '🖥️')
+        
+        status_icon = "✅" if server_info['running'] else "❌"
+        status_color = "#10b981" if server_info['running'] else "#ef4444"
+        status_text = "Running" if server_info['running'] else "Offline"
+        
+        # Get server utilization from performance monitor
+        server_status_data = server_utilization.get(server_name)
+        utilization = server_status_data.utilization if server_status_data else 0.0
+        
+        cards.append(_SERVER_CARD_TEMPLATE.format(
+            color=status_color, icon=server_icon, name=server_name.replace('_', ' ').title(),
+            status=f"{status_icon} {status_text}", utilization=utilization
+        ))
+    
+    # One flex row instead of a Streamlit column per server
+    st.markdown(_CARD_ROW_TEMPLATE.format(cards="".join(cards)), unsafe_allow_html=True)
 
 def render_analysis_interface(repo_url: Optional[str] = None) -> None:
     """Render the enhanced analysis interface with ETA tracking and tool explanations"""
@@ -34,10 +310,11 @@ def render_analysis_interface(repo_url: Optional[str] = None) -> None:
         st.info("🎯 Please select a repository to start systematic analysis.")
         return
     
-    # Get performance monitor and server status
-    performance_monitor = get_performance_monitor()
-    server_status = get_servers_status()
+    # Results survive reruns so they stay visible after interacting with other widgets
+    if "analysis_results" not in st.session_state:
+        st.session_state.analysis_results = {}
     
+    st.markdown(_CARD_CSS, unsafe_allow_html=True)
     st.markdown("### 🔍 Enhanced Repository Analysis")
     st.markdown("Choose your analysis type and get comprehensive insights with real-time progress tracking.")
     
@@ -45,203 +322,87 @@ def render_analysis_interface(repo_url: Optional[str] = None) -> None:
     st.markdown("#### 📊 Analysis Progress & Stages")
     
     # Get analysis information for all types
-    analysis_info = {}
-    for analysis_type in AnalysisType:
-        analysis_info[analysis_type] = performance_monitor.get_analysis_eta(analysis_type)
+    analysis_info = _eta_snapshot()
     
     # Display Analysis Type cards with tool counts and complexity
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        info = analysis_info[AnalysisType.ULTRA_FAST]
-        st.markdown(f"""
-        <div style="text-align: center; padding: 15px; border: 2px solid #10b981; border-radius: 12px; background: linear-gradient(135deg, #1f2937, #111827); box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);">
-            <div style="font-size: 24px; margin-bottom: 8px;">⚡</div>
-            <div style="font-weight: bold; margin: 8px 0; color: #f9fafb; font-size: 14px;">Ultra Fast</div>
-            <div style="color: #10b981; font-weight: bold; font-size: 18px;">{info['tool_count']} tools</div>
-            <div style="color: #9ca3af; font-size: 12px;">{info['complexity']} complexity</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        info = analysis_info[AnalysisType.QUICK_OVERVIEW]
-        st.markdown(f"""
-        <div style="text-align: center; padding: 15px; border: 2px solid #3b82f6; border-radius: 12px; background: linear-gradient(135deg, #1f2937, #111827); box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);">
-            <div style="font-size: 24px; margin-bottom: 8px;">🚀</div>
-            <div style="font-weight: bold; margin: 8px 0; color: #f9fafb; font-size: 14px;">Quick Overview</div>
-            <div style="color: #3b82f6; font-weight: bold; font-size: 18px;">{info['tool_count']} tools</div>
-            <div style="color: #9ca3af; font-size: 12px;">{info['complexity']} complexity</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col3:
-        info = analysis_info[AnalysisType.SMART_SUMMARY]
-        st.markdown(f"""
-        <div style="text-align: center; padding: 15px; border: 2px solid #f59e0b; border-radius: 12px; background: linear-gradient(135deg, #1f2937, #111827); box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);">
-            <div style="font-size: 24px; margin-bottom: 8px;">🧠</div>
-            <div style="font-weight: bold; margin: 8px 0; color: #f9fafb; font-size: 14px;">Smart Summary</div>
-            <div style="color: #f59e0b; font-weight: bold; font-size: 18px;">{info['tool_count']} tools</div>
-            <div style="color: #9ca3af; font-size: 12px;">{info['complexity']} complexity</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col4:
-        info = analysis_info[AnalysisType.COMPREHENSIVE]
-        st.markdown(f"""
-        <div style="text-align: center; padding: 15px; border: 2px solid #ef4444; border-radius: 12px; background: linear-gradient(135deg, #1f2937, #111827); box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);">
-            <div style="font-size: 24px; margin-bottom: 8px;">🔍</div>
-            <div style="font-weight: bold; margin: 8px 0; color: #f9fafb; font-size: 14px;">Comprehensive</div>
-            <div style="color: #ef4444; font-weight: bold; font-size: 18px;">{info['tool_count']} tools</div>
-            <div style="color: #9ca3af; font-size: 12px;">{info['complexity']} complexity</div>
-        </div>
-        """, unsafe_allow_html=True)
+    cards = "".join(
+        _ETA_CARD_TEMPLATE.format(
+            color=color, icon=icon, label=label,
+            tool_count=analysis_info[analysis_type]['tool_count'],
+            complexity=analysis_info[analysis_type]['complexity']
+        )
+        for analysis_type, color, icon, label in _ETA_CARDS
+    )
+    st.markdown(_CARD_ROW_TEMPLATE.format(cards=cards), unsafe_allow_html=True)
     
     # MCP Server Status with Utilization
-    st.markdown("#### 🔧 MCP Server Status & Utilization")
-    server_cols = st.columns(len(server_status['servers']))
-    
-    for i, (server_name, server_info) in enumerate(server_status['servers'].items()):
-        with server_cols[i]:
-            server_icon = {
-                'file_content': '📄',
-                'repository_structure': '📁',
-                'commit_history': '📝',
-                'code_search': '🔍'
-            }.get(server_name, '🖥️')
-            
-            status_icon = "✅" if server_info['running'] else "❌"
-            status_color = "#10b981" if server_info['running'] else "#ef4444"
-            status_text = "Running" if server_info['running'] else "Offline"
-            
-            # Get server utilization from performance monitor
-            server_status_data = performance_monitor.get_server_status().get(server_name)
-            utilization = server_status_data.utilization if server_status_data else 0.0
-            
-            st.markdown(f"""
-            <div style="text-align: center; padding: 15px; border: 2px solid {status_color}; border-radius: 12px; background: linear-gradient(135deg, #1f2937, #111827); box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);">
-                <div style="font-size: 32px; margin-bottom: 8px;">{server_icon}</div>
-                <div style="font-weight: bold; margin: 8px 0; color: #f9fafb; font-size: 16px;">{server_name.replace('_', ' ').title()}</div>
-                <div style="color: {status_color}; font-weight: bold; font-size: 14px; background-color: rgba(255, 255, 255, 0.1); padding: 4px 8px; border-radius: 6px; display: inline-block;">{status_icon} {status_text}</div>
-                <div style="color: #9ca3af; font-size: 12px; margin-top: 8px;">Utilization: {utilization:.1f}%</div>
-            </div>
-            """, unsafe_allow_html=True)
-    
-    # Get analysis presets and settings
-    presets = get_analysis_presets()
-    settings = get_analysis_settings()
+    _render_server_status()
     
     # Tool Explanations Section
-    with st.expander("🔧 Tool Explanations & What Each Tool Does", expanded=False):
-        st.markdown("#### 📋 Understanding the Analysis Tools")
-        st.markdown("Each analysis type uses different combinations of tools. Here's what each tool does:")
-        
-        # Get all tool explanations
-        tool_explanations = {}
-        for tool_name in performance_monitor.tools_info.keys():
-            tool_explanations[tool_name] = performance_monitor.get_tool_explanation(tool_name)
-        
-        # Group tools by server
-        server_tools = {}
-        for tool_name, tool_info in tool_explanations.items():
-            if isinstance(tool_info, dict) and 'server' in tool_info:
-                server = tool_info['server']
-                if server not in server_tools:
-                    server_tools[server] = []
-                server_tools[server].append((tool_name, tool_info))
-        
-        # Display tools grouped by server
-        for server_name, tools in server_tools.items():
-            server_icon = {
-                'file_content': '📄',
-                'repository_structure': '📁',
-                'commit_history': '📝',
-                'code_search': '🔍'
-            }.get(server_name, '🖥️')
-            
-            st.markdown(f"**{server_icon} {server_name.replace('_', ' ').title()} Server**")
-            
-            for tool_name, tool_info in tools:
-                if isinstance(tool_info, dict) and 'name' in tool_info:
-                    # Use a container instead of expander to avoid nesting
-                    with st.container():
-                        st.markdown(f"**🔧 {tool_info['name']}**")
-                        col1, col2 = st.columns([1, 2])
-                        with col1:
-                            st.markdown(f"**Duration:** {tool_info['typical_duration']}s")
-                            st.markdown(f"**Complexity:** {tool_info['complexity']}")
-                            st.markdown(f"**Server:** {tool_info['server']}")
-                        with col2:
-                            st.markdown(f"**What it does:** {tool_info['what_it_does']}")
-                            st.markdown(f"**When to use:** {tool_info['when_to_use']}")
-                        st.markdown("---")
-            
-            st.markdown("---")
+    _render_tool_explanations()
     
     # Analysis Type Selection
     st.markdown("#### 📊 Analysis Types")
+    _render_analysis_tabs(repo_url)
+
+@_fragment
+def _render_tool_explanations() -> None:
+    """Tool explanations behind a toggle; an expander would still send its whole body on every rerun"""
+    if not st.checkbox("🔧 Show Tool Explanations & What Each Tool Does", key="show_tool_explanations"):
+        return
     
-    # Create tabs for different analysis types
-    tab1, tab2, tab3, tab4, tab5, tab6, tab7 = st.tabs([
-        "🚀 Quick Overview", 
-        "🔍 Comprehensive", 
-        "🔒 Security", 
-        "📊 Code Quality",
-        "🗺️ Visualizations",
-        "🧠 Smart Summary",
-        "📈 History"
-    ])
-    
-    with tab1:
-        render_quick_analysis_tab(repo_url)
-    
-    with tab2:
-        render_comprehensive_analysis_tab(repo_url, presets)
-    
-    with tab3:
-        render_security_analysis_tab(repo_url)
-    
-    with tab4:
-        render_code_quality_tab(repo_url)
-    
-    with tab5:
-        render_visualizations_tab(repo_url)
-    
-    with tab6:
-        render_smart_summary_tab(repo_url)
-    
-    with tab7:
-        render_analysis_history_tab(repo_url)
+    with st.container():
+        st.markdown("#### 📋 Understanding the Analysis Tools")
+        st.markdown("Each analysis type uses different combinations of tools. Here's what each tool does:")
+        
+        # Display tools grouped by server, one markdown element per server
+        for panel in _tool_explanation_panels():
+            st.markdown(panel, unsafe_allow_html=True)
+            st.markdown("---")
+
+@_fragment
+def _render_analysis_tabs(repo_url: str) -> None:
+    """Render the active analysis tab; its widgets rerun only this fragment, not the cards above"""
+    # st.tabs runs every tab body on each rerun, so pick the view with a radio and
+    # render only that one
+    active_tab = st.radio(
+        "Analysis type",
+        options=_ANALYSIS_TAB_LABELS,
+        horizontal=True,
+        key="active_analysis_tab",
+        label_visibility="collapsed"
+    )
+    _ANALYSIS_TABS[active_tab](repo_url)
 
 def render_quick_analysis_tab(repo_url: str) -> None:
     """Render quick analysis tab with ETA tracking"""
     performance_monitor = get_performance_monitor()
-    eta_info = performance_monitor.get_analysis_eta(AnalysisType.QUICK_OVERVIEW)
+    eta_info = _eta_snapshot()[AnalysisType.QUICK_OVERVIEW]
     
     st.markdown("#### ⚡ Quick Repository Overview")
     st.markdown("Get a fast overview of the repository with basic insights.")
     
     # Display analysis information
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        st.metric("🔧 Tools Used", eta_info['tool_count'])
-    with col2:
-        st.metric("📊 Complexity", eta_info['complexity'])
-    with col3:
-        st.metric("⚡ Speed", "Fast")
+    _metric_strip([
+        ("🔧 Tools Used", eta_info['tool_count']),
+        ("📊 Complexity", eta_info['complexity']),
+        ("⚡ Speed", "Fast")
+    ])
     
     # Show expected tools
     with st.expander("🔧 Expected Tools for This Analysis", expanded=False):
-        for tool_name in eta_info['expected_tools']:
-            tool_info = performance_monitor.get_tool_explanation(tool_name)
-            if isinstance(tool_info, dict) and 'name' in tool_info:
-                st.markdown(f"• **{tool_info['name']}** ({tool_info['typical_duration']}s) - {tool_info['description']}")
+        st.markdown(_expected_tools_markdown(AnalysisType.QUICK_OVERVIEW))
     
-    if st.button("🚀 Start Quick Analysis", type="primary", use_container_width=True):
+    results = st.session_state.analysis_results
+    result_key = f"quick_{repo_url}"
+    
+    if _start_button("🚀 Start Quick Analysis", result_key):
         # Start tracking analysis
         performance_monitor.start_analysis(AnalysisType.QUICK_OVERVIEW, repo_url)
         
         # Create progress display container
         progress_container = st.container()
+        redraw_due = _redraw_throttle()
         
         def enhanced_status_callback(msg, progress=None, current_tool=None):
             # Update progress data
@@ -262,88 +423,96 @@ def render_quick_analysis_tab(repo_url: str) -> None:
                     performance_monitor.start_stage(AnalysisStage.AI_SUMMARY)
                     stage_progress = (progress - 80) / 20 * 100
                     performance_monitor.update_stage_progress(AnalysisStage.AI_SUMMARY, stage_progress, current_tool)
-                
-                # Update progress display
-                with progress_container:
-                    progress_data = performance_monitor.get_progress_data()
-                    render_enhanced_progress_display(progress_data)
             
+                # Update progress display, at most every _PROGRESS_REDRAW_INTERVAL seconds
+                if redraw_due(progress):
+                    with progress_container:
+                        progress_data = performance_monitor.get_progress_data()
+                        render_enhanced_progress_display(progress_data)
+        
             # Complete tools as they finish
             if current_tool:
-                # Map tools to stages
-                if "readme" in current_tool.lower() or "file" in current_tool.lower():
-                    performance_monitor.complete_tool(AnalysisStage.DATA_GATHERING, current_tool)
-                elif "code" in current_tool.lower() or "metrics" in current_tool.lower():
-                    performance_monitor.complete_tool(AnalysisStage.CODE_ANALYSIS, current_tool)
-                elif "summary" in current_tool.lower() or "ai" in current_tool.lower():
-                    performance_monitor.complete_tool(AnalysisStage.AI_SUMMARY, current_tool)
+                _complete_tool_stage(performance_monitor, current_tool, _QUICK_TOOL_STAGES)
         
         with st.spinner("⚡ Performing quick analysis..."):
             try:
-                result = quick_analysis(repo_url, enhanced_status_callback)
-                
+                result = run_cached_analysis("quick", repo_url, enhanced_status_callback)
+            
                 # Complete final stage
                 performance_monitor.start_stage(AnalysisStage.FINALIZATION)
                 performance_monitor.update_stage_progress(AnalysisStage.FINALIZATION, 100)
-                
+            
                 # Show final progress
                 with progress_container:
                     progress_data = performance_monitor.get_progress_data()
                     render_enhanced_progress_display(progress_data)
-                
-                display_quick_analysis_results(result)
+            
+                results[result_key] = result
             except Exception as e:
-                st.error(f"❌ Analysis failed: {str(e)}")
+                results[result_key] = {"error": str(e)}
+    
+    if result_key in results:
+        display_quick_analysis_results(results[result_key], result_key)
+
+@functools.lru_cache(maxsize=1)
+def _preset_choices() -> Dict[str, str]:
+    """Map each preset's selectbox label to its id; presets are static, so this is built once"""
+    return {
+        f"{preset['name']} - {preset['description']}": preset_id
+        for preset_id, preset in get_analysis_presets().items()
+    }
 
-def render_comprehensive_analysis_tab(repo_url: str, presets: Dict[str, Any]) -> None:
+def render_comprehensive_analysis_tab(repo_url: str) -> None:
     """Render comprehensive analysis tab with ETA tracking"""
     performance_monitor = get_performance_monitor()
-    eta_info = performance_monitor.get_analysis_eta(AnalysisType.COMPREHENSIVE)
+    eta_info = _eta_snapshot()[AnalysisType.COMPREHENSIVE]
     
     st.markdown("#### 🔍 Comprehensive Repository Analysis")
     st.markdown("Get detailed insights with multiple analysis dimensions.")
     
     # Display analysis information
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        st.metric("🔧 Tools Used", eta_info['tool_count'])
-    with col2:
-        st.metric("📊 Complexity", eta_info['complexity'])
-    with col3:
-        st.metric("🔍 Depth", "Comprehensive")
+    _metric_strip([
+        ("🔧 Tools Used", eta_info['tool_count']),
+        ("📊 Complexity", eta_info['complexity']),
+        ("🔍 Depth", "Comprehensive")
+    ])
     
     # Show expected tools
     with st.expander("🔧 Expected Tools for This Analysis", expanded=False):
-        for tool_name in eta_info['expected_tools']:
-            tool_info = performance_monitor.get_tool_explanation(tool_name)
-            if isinstance(tool_info, dict) and 'name' in tool_info:
-                st.markdown(f"• **{tool_info['name']}** ({tool_info['typical_duration']}s) - {tool_info['description']}")
+        st.markdown(_expected_tools_markdown(AnalysisType.COMPREHENSIVE))
     
     # Preset selection
-    preset_options = {preset["name"]: preset_id for preset_id, preset in presets.items()}
+    preset_choices = _preset_choices()
     selected_preset = st.selectbox(
         "Choose Analysis Preset:",
-        options=list(preset_options.keys()),
-        format_func=lambda x: f"{x} - {presets[preset_options[x]]['description']}"
+        options=list(preset_choices)
     )
+    preset_id = preset_choices[selected_preset]
+    preset = get_analysis_presets()[preset_id]
     
-    # Analysis options
+    # Analysis options default to the preset's; keyed per preset so switching presets resets them
     col1, col2 = st.columns(2)
     with col1:
-        include_metrics = st.checkbox("Include Code Metrics", value=True)
-        include_security = st.checkbox("Include Security Analysis", value=True)
+        include_metrics = st.checkbox("Include Code Metrics", value=preset.get("include_metrics", True),
+                                      key=f"include_metrics_{preset_id}")
+        include_security = st.checkbox("Include Security Analysis", value=preset.get("include_security", True),
+                                       key=f"include_security_{preset_id}")
     with col2:
-        include_dependencies = st.checkbox("Include Dependency Analysis", value=True)
-        include_commits = st.checkbox("Include Commit History", value=True)
+        include_dependencies = st.checkbox("Include Dependency Analysis", value=preset.get("include_dependencies", True),
+                                           key=f"include_dependencies_{preset_id}")
+        include_commits = st.checkbox("Include Commit History", value=preset.get("include_commits", True),
+                                      key=f"include_commits_{preset_id}")
     
-    if st.button("🔍 Start Comprehensive Analysis", type="primary", use_container_width=True):
-        preset_id = preset_options[selected_preset]
-        
+    results = st.session_state.analysis_results
+    result_key = f"comprehensive_{repo_url}"
+    
+    if _start_button("🔍 Start Comprehensive Analysis", result_key):
         # Start tracking analysis
         performance_monitor.start_analysis(AnalysisType.COMPREHENSIVE, repo_url)
         
         # Create progress display container
         progress_container = st.container()
+        redraw_due = _redraw_throttle()
         
         def enhanced_status_callback(msg, progress=None, current_tool=None):
             # Update progress data
@@ -372,113 +541,88 @@ def render_comprehensive_analysis_tab(repo_url: str, presets: Dict[str, Any]) ->
                     performance_monitor.start_stage(AnalysisStage.AI_SUMMARY)
                     stage_progress = (progress - 90) / 10 * 100
                     performance_monitor.update_stage_progress(AnalysisStage.AI_SUMMARY, stage_progress, current_tool)
-                
-                # Update progress display
-                with progress_container:
-                    progress_data = performance_monitor.get_progress_data()
-                    render_enhanced_progress_display(progress_data)
             
+                # Update progress display, at most every _PROGRESS_REDRAW_INTERVAL seconds
+                if redraw_due(progress):
+                    with progress_container:
+                        progress_data = performance_monitor.get_progress_data()
+                        render_enhanced_progress_display(progress_data)
+        
             # Complete tools as they finish
             if current_tool:
-                # Map tools to stages
-                if "readme" in current_tool.lower() or "file" in current_tool.lower() or "directory" in current_tool.lower():
-                    performance_monitor.complete_tool(AnalysisStage.DATA_GATHERING, current_tool)
-                elif "code" in current_tool.lower() or "metrics" in current_tool.lower() or "complexity" in current_tool.lower():
-                    performance_monitor.complete_tool(AnalysisStage.CODE_ANALYSIS, current_tool)
-                elif "security" in current_tool.lower() or "vulnerability" in current_tool.lower() or "dependency" in current_tool.lower():
-                    performance_monitor.complete_tool(AnalysisStage.SECURITY_SCAN, current_tool)
-                elif "quality" in current_tool.lower() or "documentation" in current_tool.lower() or "testing" in current_tool.lower():
-                    performance_monitor.complete_tool(AnalysisStage.QUALITY_ASSESSMENT, current_tool)
-                elif "summary" in current_tool.lower() or "ai" in current_tool.lower():
-                    performance_monitor.complete_tool(AnalysisStage.AI_SUMMARY, current_tool)
+                _complete_tool_stage(performance_monitor, current_tool, _COMPREHENSIVE_TOOL_STAGES)
         
         with st.spinner("🔍 Performing comprehensive analysis..."):
             try:
-                result = analyze_repository(repo_url, "comprehensive", preset_id, enhanced_status_callback)
-                
+                result = run_cached_analysis("comprehensive", repo_url, enhanced_status_callback, preset_id, {
+                    "include_metrics": include_metrics,
+                    "include_security": include_security,
+                    "include_dependencies": include_dependencies,
+                    "include_commits": include_commits
+                })
+            
                 # Complete final stage
                 performance_monitor.start_stage(AnalysisStage.FINALIZATION)
                 performance_monitor.update_stage_progress(AnalysisStage.FINALIZATION, 100)
-                
+            
                 # Show final progress
                 with progress_container:
                     progress_data = performance_monitor.get_progress_data()
                     render_enhanced_progress_display(progress_data)
-                
-                display_comprehensive_analysis_results(result)
+            
+                results[result_key] = result
             except Exception as e:
-                st.error(f"❌ Analysis failed: {str(e)}")
-
-def render_security_analysis_tab(repo_url: str) -> None:
-    """Render security analysis tab"""
-    st.markdown("#### 🔒 Security Analysis")
-    st.markdown("Analyze security aspects and potential vulnerabilities.")
-    
-    # Security analysis options
-    col1, col2 = st.columns(2)
-    with col1:
-        check_dependencies = st.checkbox("Check Dependency Vulnerabilities", value=True)
-        check_patterns = st.checkbox("Check Security Patterns", value=True)
-    with col2:
-        check_credentials = st.checkbox("Check for Hardcoded Credentials", value=True)
-        check_permissions = st.checkbox("Check File Permissions", value=True)
+                results[result_key] = {"error": str(e)}
     
-    if st.button("🔒 Start Security Analysis", type="primary", use_container_width=True):
-        with st.spinner("🔒 Performing security analysis..."):
-            def status_callback(msg):
-                st.text(msg)
-            
-            result = security_analysis(repo_url, status_callback)
-            display_security_analysis_results(result)
+    if result_key in results:
+        display_comprehensive_analysis_results(results[result_key], result_key)
 
-def render_code_quality_tab(repo_url: str) -> None:
-    """Render code quality analysis tab"""
-    st.markdown("#### 📊 Code Quality Analysis")
-    st.markdown("Analyze code quality, patterns, and best practices.")
-    
-    # Quality analysis options
-    col1, col2 = st.columns(2)
-    with col1:
-        analyze_patterns = st.checkbox("Analyze Code Patterns", value=True)
-        check_documentation = st.checkbox("Check Documentation", value=True)
-    with col2:
-        analyze_testing = st.checkbox("Analyze Testing", value=True)
-        check_metrics = st.checkbox("Check Code Metrics", value=True)
+def _run_with_status(kind: str, repo_url: str, label: str) -> Dict[str, Any]:
+    """Run a cached analysis, showing its progress messages in one status element updated in place"""
+    with st.status(label, expanded=False) as status:
+        # One element relabelled per message instead of a new st.text line each time,
+        # throttled since the final label below always replaces it
+        redraw_due = _redraw_throttle()
+        
+        def status_callback(msg):
+            if redraw_due():
+                status.update(label=msg)
+        
+        result = run_cached_analysis(kind, repo_url, status_callback)
+        
+        if "error" in result:
+            status.update(label="❌ Analysis failed", state="error")
+        else:
+            status.update(label="✅ Analysis complete", state="complete")
     
-    if st.button("📊 Start Code Quality Analysis", type="primary", use_container_width=True):
-        with st.spinner("📊 Performing code quality analysis..."):
-            def status_callback(msg):
-                st.text(msg)
-            
-            result = code_quality_analysis(repo_url, status_callback)
-            display_code_quality_results(result)
+    return result
 
-def render_visualizations_tab(repo_url: str) -> None:
-    """Render repository visualizations tab"""
-    st.markdown("#### 🗺️ Repository Visualizations")
-    st.markdown("Generate interactive visualizations and repository maps.")
-    
-    # Visualization options
-    col1, col2 = st.columns(2)
-    with col1:
-        include_tree = st.checkbox("Directory Tree", value=True)
-        include_structure = st.checkbox("File Structure", value=True)
-        include_dependencies = st.checkbox("Dependency Graph", value=True)
-    with col2:
-        include_heatmap = st.checkbox("Activity Heatmap", value=True)
-        include_languages = st.checkbox("Language Distribution", value=True)
-        include_sizes = st.checkbox("File Size Distribution", value=True)
-    
-    if st.button("🗺️ Generate Visualizations", type="primary", use_container_width=True):
-        with st.spinner("🗺️ Generating visualizations..."):
-            def status_callback(msg):
-                st.text(msg)
-            
-            result = generate_visualizations(repo_url, status_callback)
-            display_visualization_results(result)
+def render_simple_analysis_tab(spec: Dict[str, Any], repo_url: str) -> None:
+    """Render an analysis tab that is just options, a start button and its results"""
+    st.markdown(spec["title"])
+    st.markdown(spec["description"])
+    
+    # Analysis options, split over two columns
+    columns = st.columns(2)
+    for column, labels in zip(columns, spec["options"]):
+        with column:
+            for label in labels:
+                st.checkbox(label, value=True)
+    
+    results = st.session_state.analysis_results
+    result_key = f"{spec['key']}_{repo_url}"
+    
+    if _start_button(spec["button"], result_key):
+        result = _run_with_status(spec["key"], repo_url, spec["spinner"])
+        results[result_key] = result
+    
+    if result_key in results:
+        spec["display"](results[result_key], result_key)
 
 def render_smart_summary_tab(repo_url: str) -> None:
     """Render smart summarization tab"""
+    performance_monitor = get_performance_monitor()
+    
     st.markdown("#### 🧠 Smart Repository Summarization")
     st.markdown("Generate comprehensive AI-powered summaries with deep insights.")
     
@@ -511,7 +655,10 @@ def render_smart_summary_tab(repo_url: str) -> None:
     else:
         button_text = "🔍 Generate Comprehensive Summary"
     
-    if st.button(button_text, type="primary", use_container_width=True):
+    results = st.session_state.analysis_results
+    result_key = f"smart_summary_{repo_url}"
+    
+    if _start_button(button_text, result_key):
         # Determine analysis type based on speed option
         if speed_option == "⚡ Ultra Fast (30s)":
             analysis_type = AnalysisType.ULTRA_FAST
@@ -525,6 +672,7 @@ def render_smart_summary_tab(repo_url: str) -> None:
         
         # Create progress display container
         progress_container = st.container()
+        redraw_due = _redraw_throttle()
         
         def enhanced_status_callback(msg, progress=None, current_tool=None):
             # Update progress data
@@ -545,44 +693,45 @@ def render_smart_summary_tab(repo_url: str) -> None:
                     performance_monitor.start_stage(AnalysisStage.AI_SUMMARY)
                     stage_progress = (progress - 75) / 25 * 100
                     performance_monitor.update_stage_progress(AnalysisStage.AI_SUMMARY, stage_progress, current_tool)
-                
-                # Update progress display
-                with progress_container:
-                    progress_data = performance_monitor.get_progress_data()
-                    render_enhanced_progress_display(progress_data)
             
+                # Update progress display, at most every _PROGRESS_REDRAW_INTERVAL seconds
+                if redraw_due(progress):
+                    with progress_container:
+                        progress_data = performance_monitor.get_progress_data()
+                        render_enhanced_progress_display(progress_data)
+        
             # Complete tools as they finish
             if current_tool:
-                # Map tools to stages
-                if "readme" in current_tool.lower() or "file" in current_tool.lower() or "directory" in current_tool.lower():
-                    performance_monitor.complete_tool(AnalysisStage.DATA_GATHERING, current_tool)
-                elif "code" in current_tool.lower() or "metrics" in current_tool.lower() or "complexity" in current_tool.lower():
-                    performance_monitor.complete_tool(AnalysisStage.CODE_ANALYSIS, current_tool)
-                elif "summary" in current_tool.lower() or "ai" in current_tool.lower():
-                    performance_monitor.complete_tool(AnalysisStage.AI_SUMMARY, current_tool)
+                _complete_tool_stage(performance_monitor, current_tool, _SUMMARY_TOOL_STAGES)
         
         try:
             # Use different analysis methods based on speed option
             if speed_option == "⚡ Ultra Fast (30s)":
-                result = ultra_fast_summarization(repo_url, enhanced_status_callback)
+                result = run_cached_analysis("ultra_fast_summary", repo_url, enhanced_status_callback)
             elif speed_option == "🚀 Fast (60s)":
-                result = smart_summarization(repo_url, enhanced_status_callback)
+                result = run_cached_analysis("smart_summary", repo_url, enhanced_status_callback)
             else:
-                result = comprehensive_smart_summarization(repo_url, enhanced_status_callback)
-            
+                result = run_cached_analysis("comprehensive_summary", repo_url, enhanced_status_callback)
+        
             # Complete final stage
             performance_monitor.start_stage(AnalysisStage.FINALIZATION)
             performance_monitor.update_stage_progress(AnalysisStage.FINALIZATION, 100)
-            
+        
             # Show final progress
             with progress_container:
                 progress_data = performance_monitor.get_progress_data()
                 render_enhanced_progress_display(progress_data)
-            
-            display_smart_summary_results(result)
-            
+        
+            results[result_key] = result
+        
         except Exception as e:
-            st.error(f"❌ Analysis failed: {str(e)}")
+            results[result_key] = {"error": str(e)}
+    
+    if result_key in results:
+        display_smart_summary_results(results[result_key], result_key)
+
+# Number of history entries rendered per page
+_HISTORY_PAGE_SIZE = 10
 
 def render_analysis_history_tab(repo_url: str) -> None:
     """Render analysis history tab"""
@@ -596,12 +745,65 @@ def render_analysis_history_tab(repo_url: str) -> None:
         st.info("📝 No analysis history found. Run an analysis to see results here.")
         return
     
+    # Only the current page of entries is rendered, newest first
+    page_count = (len(history) + _HISTORY_PAGE_SIZE - 1) // _HISTORY_PAGE_SIZE
+    page = min(st.session_state.get("history_page", 0), page_count - 1)
+    st.session_state.history_page = page
+    
+    if page_count > 1:
+        col1, col2, col3 = st.columns([1, 2, 1])
+        with col1:
+            st.button("⬅️ Newer", key="history_newer", disabled=page == 0,
+                      on_click=_change_history_page, args=(-1,), use_container_width=True)
+        with col2:
+            st.caption(f"Page {page + 1} of {page_count} ({len(history)} analyses)")
+        with col3:
+            st.button("Older ➡️", key="history_older", disabled=page >= page_count - 1,
+                      on_click=_change_history_page, args=(1,), use_container_width=True)
+    
+    end = len(history) - page * _HISTORY_PAGE_SIZE
+    start = max(0, end - _HISTORY_PAGE_SIZE)
+    
     # Display history
-    for entry in reversed(history):
+    for entry in reversed(history[start:end]):
         with st.expander(f"📊 {entry['type'].title()} Analysis - {entry['timestamp']}"):
             display_analysis_entry(entry)
 
-def display_quick_analysis_results(result: Dict[str, Any]) -> None:
+def _change_history_page(delta: int) -> None:
+    """Move the history tab to a newer (-1) or older (+1) page"""
+    st.session_state.history_page = st.session_state.get("history_page", 0) + delta
+
+def _group_tools_by_server(tools_used: Sequence[str]) -> Dict[str, List[str]]:
+    """Group 'server.tool' names by server; names without a server prefix go under 'unknown'"""
+    server_tools = defaultdict(list)
+    for tool in tools_used:
+        server, sep, tool_name = tool.partition('.')
+        if sep:
+            server_tools[server].append(tool_name)
+        else:
+            server_tools['unknown'].append(tool)
+    return server_tools
+
+@functools.lru_cache(maxsize=128)
+def _tools_used_markdown(tools_used: Tuple[str, ...]) -> str:
+    """Build the markdown listing the tools an analysis used, grouped by MCP server"""
+    # Memoized on the tuple of names, so each result's list is grouped and formatted once
+    # rather than on every rerun; the cached value is an immutable string
+    server_tools = _group_tools_by_server(tools_used)
+    
+    lines = [_HDR_TOOLS_USED]
+    for server, tools in server_tools.items():
+        server_icon = SERVER_ICONS.get(server, '🔧')
+        lines.append(f"**{server_icon} {server.replace('_', ' ').title()} Server:**")
+        lines.append(f"  - {', '.join(tools)}")
+    return "\n\n".join(lines)
+
+def _render_tools_used(tools_used: Optional[List[str]]) -> None:
+    """Display the tools an analysis used, grouped by MCP server, as a single markdown element"""
+    if tools_used:
+        st.markdown(_tools_used_markdown(tuple(tools_used)))
+
+def display_quick_analysis_results(result: Dict[str, Any], key: str) -> None:
     """Display quick analysis results"""
     if "error" in result:
         st.error(f"❌ Analysis failed: {result['error']}")
@@ -614,49 +816,18 @@ def display_quick_analysis_results(result: Dict[str, Any]) -> None:
         perf_stats = result["performance_stats"]
         st.markdown("#### 📊 Performance Statistics")
         
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            st.metric("Total Calls", perf_stats.get("total_calls", 0))
-        with col2:
-            st.metric("Cache Hit Rate", perf_stats.get("cache_hit_rate", "0%"))
-        with col3:
-            st.metric("Avg Call Time", perf_stats.get("average_call_time", "0s"))
+        _metric_grid([
+            ("Total Calls", perf_stats.get("total_calls", 0)),
+            ("Cache Hit Rate", perf_stats.get("cache_hit_rate", "0%")),
+            ("Avg Call Time", perf_stats.get("average_call_time", "0s"))
+        ])
         
         # Show performance insights
         if "execution_time" in result:
             st.info(f"⚡ Data gathering completed in {result['execution_time']:.2f}s")
     
     # Display tool utilization
-    if "tools_used" in result and result["tools_used"]:
-        st.markdown("#### 🔧 Tools Used")
-        tools_used = result["tools_used"]
-        
-        # Group tools by server
-        server_tools = {}
-        for tool in tools_used:
-            if '.' in tool:
-                server, tool_name = tool.split('.', 1)
-                if server not in server_tools:
-                    server_tools[server] = []
-                server_tools[server].append(tool_name)
-            else:
-                if 'unknown' not in server_tools:
-                    server_tools['unknown'] = []
-                server_tools['unknown'].append(tool)
-        
-        # Display grouped by server
-        for server, tools in server_tools.items():
-            server_icon = {
-                'file_content': '📄',
-                'repository_structure': '📁',
-                'commit_history': '📝',
-                'code_search': '🔍',
-                'unknown': '❓'
-            }.get(server, '🔧')
-            
-            st.markdown(f"**{server_icon} {server.replace('_', ' ').title()} Server:**")
-            st.write(f"  - {', '.join(tools)}")
-            st.markdown("")
+    _render_tools_used(result.get("tools_used"))
     
     # Display sections
     sections = result.get("sections", {})
@@ -667,29 +838,25 @@ def display_quick_analysis_results(result: Dict[str, Any]) -> None:
         if not isinstance(repo_info, dict) or "error" in repo_info:
             st.warning("⚠️ Could not fetch repository information")
         else:
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                st.metric("⭐ Stars", repo_info.get("stars", 0))
-            with col2:
-                st.metric("🍴 Forks", repo_info.get("forks", 0))
-            with col3:
-                st.metric("👀 Watchers", repo_info.get("watchers", 0))
+            _metric_grid([
+                ("⭐ Stars", repo_info.get("stars", 0)),
+                ("🍴 Forks", repo_info.get("forks", 0)),
+                ("👀 Watchers", repo_info.get("watchers", 0))
+            ])
     
     # AI Summary
     if "ai_summary" in sections:
         ai_summary = sections["ai_summary"]
         if isinstance(ai_summary, dict) and "summary" in ai_summary:
-            st.markdown("#### 🤖 AI Summary")
-            st.write(ai_summary["summary"])
+            _render_text_section(_HDR_AI_SUMMARY, ai_summary["summary"])
     
     # File Structure
-    if "file_structure" in sections:
-        file_structure = sections["file_structure"]
-        if isinstance(file_structure, dict) and "result" in file_structure:
-            st.markdown("#### 📁 File Structure")
-            st.json(file_structure["result"])
+    file_structure = _unwrap(sections.get("file_structure"))
+    if file_structure is not None:
+        st.markdown("#### 📁 File Structure")
+        _render_json(file_structure, f"{key}_file_structure")
 
-def display_comprehensive_analysis_results(result: Dict[str, Any]) -> None:
+def display_comprehensive_analysis_results(result: Dict[str, Any], key: str) -> None:
     """Display comprehensive analysis results"""
     if "error" in result:
         st.error(f"❌ Analysis failed: {result['error']}")
@@ -698,37 +865,7 @@ def display_comprehensive_analysis_results(result: Dict[str, Any]) -> None:
     st.success(f"✅ Comprehensive analysis completed in {result.get('duration', 0):.2f} seconds")
     
     # Display tool utilization
-    if "tools_used" in result and result["tools_used"]:
-        st.markdown("#### 🔧 Tools Used")
-        tools_used = result["tools_used"]
-        
-        # Group tools by server
-        server_tools = {}
-        for tool in tools_used:
-            if '.' in tool:
-                server, tool_name = tool.split('.', 1)
-                if server not in server_tools:
-                    server_tools[server] = []
-                server_tools[server].append(tool_name)
-            else:
-                if 'unknown' not in server_tools:
-                    server_tools['unknown'] = []
-                server_tools['unknown'].append(tool)
-        
-        # Display grouped by server
-        for server, tools in server_tools.items():
-            server_icon = {
-                'file_content': '📄',
-                'repository_structure': '📁',
-                'commit_history': '📝',
-                'code_search': '🔍',
-                'unknown': '❓'
-            }.get(server, '🔧')
-            
-            st.markdown(f"**{server_icon} {server.replace('_', ' ').title()} Server:**")
-            for tool in tools:
-                st.write(f"  - {tool}")
-            st.markdown("")
+    _render_tools_used(result.get("tools_used"))
     
     # Display sections
     sections = result.get("sections", {})
@@ -740,9 +877,9 @@ def display_comprehensive_analysis_results(result: Dict[str, Any]) -> None:
         
         for i, (section_name, section_data) in enumerate(sections.items()):
             with tabs[i]:
-                display_analysis_section(section_name, section_data)
+                display_analysis_section(section_name, section_data, f"{key}_{section_name}")
 
-def display_security_analysis_results(result: Dict[str, Any]) -> None:
+def display_security_analysis_results(result: Dict[str, Any], key: str) -> None:
     """Display security analysis results"""
     if "error" in result:
         st.error(f"❌ Security analysis failed: {result['error']}")
@@ -751,37 +888,7 @@ def display_security_analysis_results(result: Dict[str, Any]) -> None:
     st.success(f"✅ Security analysis completed in {result.get('duration', 0):.2f} seconds")
     
     # Display tool utilization
-    if "tools_used" in result and result["tools_used"]:
-        st.markdown("#### 🔧 Tools Used")
-        tools_used = result["tools_used"]
-        
-        # Group tools by server
-        server_tools = {}
-        for tool in tools_used:
-            if '.' in tool:
-                server, tool_name = tool.split('.', 1)
-                if server not in server_tools:
-                    server_tools[server] = []
-                server_tools[server].append(tool_name)
-            else:
-                if 'unknown' not in server_tools:
-                    server_tools['unknown'] = []
-                server_tools['unknown'].append(tool)
-        
-        # Display grouped by server
-        for server, tools in server_tools.items():
-            server_icon = {
-                'file_content': '📄',
-                'repository_structure': '📁',
-                'commit_history': '📝',
-                'code_search': '🔍',
-                'unknown': '❓'
-            }.get(server, '🔧')
-            
-            st.markdown(f"**{server_icon} {server.replace('_', ' ').title()} Server:**")
-            for tool in tools:
-                st.write(f"  - {tool}")
-            st.markdown("")
+    _render_tools_used(result.get("tools_used"))
     
     sections = result.get("sections", {})
     
@@ -790,7 +897,7 @@ def display_security_analysis_results(result: Dict[str, Any]) -> None:
         security_data = sections["security"]
         if isinstance(security_data, dict) and "risk_level" in security_data:
             risk_level = security_data["risk_level"]
-            risk_color = {"low": "🟢", "medium": "🟡", "high": "🔴"}.get(risk_level, "⚪")
+            risk_color = _RISK_ICONS.get(risk_level, "⚪")
             st.metric("🔒 Security Risk Level", f"{risk_color} {risk_level.upper()}")
     
     # Security Patterns
@@ -799,13 +906,9 @@ def display_security_analysis_results(result: Dict[str, Any]) -> None:
         if isinstance(security_data, dict) and "security_patterns" in security_data:
             patterns = security_data["security_patterns"]
             st.markdown("#### 🔍 Security Patterns Found")
-            
-            for pattern_name, pattern_data in patterns.items():
-                if pattern_data and isinstance(pattern_data, dict) and pattern_data.get("result"):
-                    st.warning(f"⚠️ {pattern_name.replace('_', ' ').title()}")
-                    st.json(pattern_data["result"])
+            _render_results(patterns, st.warning, "⚠️ {title}", f"{key}_security_patterns")
 
-def display_code_quality_results(result: Dict[str, Any]) -> None:
+def display_code_quality_results(result: Dict[str, Any], key: str) -> None:
     """Display code quality analysis results"""
     if "error" in result:
         st.error(f"❌ Code quality analysis failed: {result['error']}")
@@ -814,36 +917,7 @@ def display_code_quality_results(result: Dict[str, Any]) -> None:
     st.success(f"✅ Code quality analysis completed in {result.get('duration', 0):.2f} seconds")
     
     # Display tool utilization
-    if "tools_used" in result and result["tools_used"]:
-        st.markdown("#### 🔧 Tools Used")
-        tools_used = result["tools_used"]
-        
-        # Group tools by server
-        server_tools = {}
-        for tool in tools_used:
-            if '.' in tool:
-                server, tool_name = tool.split('.', 1)
-                if server not in server_tools:
-                    server_tools[server] = []
-                server_tools[server].append(tool_name)
-            else:
-                if 'unknown' not in server_tools:
-                    server_tools['unknown'] = []
-                server_tools['unknown'].append(tool)
-        
-        # Display grouped by server
-        for server, tools in server_tools.items():
-            server_icon = {
-                'file_content': '📄',
-                'repository_structure': '📁',
-                'commit_history': '📝',
-                'code_search': '🔍',
-                'unknown': '❓'
-            }.get(server, '🔧')
-            
-            st.markdown(f"**{server_icon} {server.replace('_', ' ').title()} Server:**")
-            st.write(f"  - {', '.join(tools)}")
-            st.markdown("")
+    _render_tools_used(result.get("tools_used"))
     
     sections = result.get("sections", {})
     
@@ -851,24 +925,83 @@ def display_code_quality_results(result: Dict[str, Any]) -> None:
     if "code_metrics" in sections:
         metrics_data = sections["code_metrics"]
         if isinstance(metrics_data, dict) and "metrics" in metrics_data:
-            metrics = metrics_data["metrics"]
-            if isinstance(metrics, dict) and "result" in metrics:
-                st.markdown("#### 📊 Code Metrics")
-                st.json(metrics["result"])
+            metrics = _unwrap(metrics_data["metrics"])
+            if metrics is not None:
+                st.markdown(_HDR_CODE_METRICS)
+                _render_json(metrics, f"{key}_code_metrics")
     
     # Code Patterns
     if "code_patterns" in sections:
         patterns_data = sections["code_patterns"]
         if isinstance(patterns_data, dict) and "code_patterns" in patterns_data:
             patterns = patterns_data["code_patterns"]
-            st.markdown("#### 🔍 Code Patterns")
-            
-            for pattern_name, pattern_data in patterns.items():
-                if pattern_data and isinstance(pattern_data, dict) and pattern_data.get("result"):
-                    st.info(f"📝 {pattern_name.replace('_', ' ').title()}")
-                    st.json(pattern_data["result"])
+            st.markdown(_HDR_CODE_PATTERNS)
+            _render_results(patterns, st.info, "📝 {title}", f"{key}_code_patterns")
+
+def _unwrap(response: Any, key: str = "result") -> Any:
+    """Return the payload of an MCP tool response, or None when it has none"""
+    return response[key] if isinstance(response, dict) and key in response else None
 
-def display_analysis_section(section_name: str, section_data: Any) -> None:
+def _render_results(responses: Dict[str, Any], header: Callable[[str], Any], header_fmt: str,
+                    key: str, renderer: Callable[[Any], Any] = None) -> None:
+    """Render every non-empty tool response in a name -> response mapping under its own header"""
+    for name, response in responses.items():
+        payload = _unwrap(response)
+        if payload:
+            header(header_fmt.format(name=name, title=name.replace('_', ' ').title()))
+            if renderer is not None:
+                renderer(payload)
+            else:
+                _render_json(payload, f"{key}_{name}")
+
+# Payloads larger than this are shown as a preview until the user asks for the full data
+_JSON_PREVIEW_BYTES = 64_000
+_JSON_PREVIEW_ITEMS = 50
+_JSON_PREVIEW_CHARS = 500
+
+def _truncate_json(data: Any, depth: int = 0) -> Any:
+    """Trim long lists, dicts and strings so a preview stays small"""
+    if isinstance(data, dict):
+        if depth >= 4:
+            return f"{{… {len(data)} keys}}"
+        items = list(data.items())
+        preview = {key: _truncate_json(value, depth + 1) for key, value in items[:_JSON_PREVIEW_ITEMS]}
+        if len(items) > _JSON_PREVIEW_ITEMS:
+            preview["…"] = f"{len(items) - _JSON_PREVIEW_ITEMS} more keys"
+        return preview
+    if isinstance(data, list):
+        if depth >= 4:
+            return f"[… {len(data)} items]"
+        preview = [_truncate_json(value, depth + 1) for value in data[:_JSON_PREVIEW_ITEMS]]
+        if len(data) > _JSON_PREVIEW_ITEMS:
+            preview.append(f"… {len(data) - _JSON_PREVIEW_ITEMS} more items")
+        return preview
+    if isinstance(data, str) and len(data) > _JSON_PREVIEW_CHARS:
+        return data[:_JSON_PREVIEW_CHARS] + "…"
+    return data
+
+def _show_full_json(state_key: str) -> None:
+    """Remember that the user asked for the full payload"""
+    st.session_state[state_key] = True
+
+def _render_json(data: Any, key: str, max_bytes: int = _JSON_PREVIEW_BYTES) -> None:
+    """Render JSON collapsed, previewing large payloads until the full data is requested"""
+    serialized = data if isinstance(data, str) else json.dumps(data, default=str)
+    
+    # key names the result and section being shown, so it is unique per render and stable across reruns
+    state_key = f"json_full_{key}"
+    if len(serialized) <= max_bytes or st.session_state.get(state_key):
+        st.json(data, expanded=False)
+        return
+    
+    st.caption(f"Showing a preview of {len(serialized):,} characters")
+    if isinstance(data, str):
+        st.code(data[:max_bytes] + "…", language="json")
+    else:
+        st.json(_truncate_json(data), expanded=False)
+    st.button("Load full data", key=f"{state_key}_button", on_click=_show_full_json, args=(state_key,))
+
+def display_analysis_section(section_name: str, section_data: Any, key: str) -> None:
     """Display a specific analysis section"""
     if not section_data:
         st.info("No data available for this section.")
@@ -878,160 +1011,139 @@ def display_analysis_section(section_name: str, section_data: Any) -> None:
         st.error(f"Error in {section_name}: {section_data['error']}")
         return
     
-    # Handle different section types
-    if section_name == "repository_info":
-        display_repository_info(section_data)
-    elif section_name == "file_structure":
-        display_file_structure(section_data)
-    elif section_name == "code_metrics":
-        display_code_metrics(section_data)
-    elif section_name == "dependencies":
-        display_dependencies(section_data)
-    elif section_name == "commit_history":
-        display_commit_history(section_data)
-    elif section_name == "security":
-        display_security_data(section_data)
-    elif section_name == "ai_summary":
-        display_ai_summary(section_data)
-    else:
-        st.json(section_data)
+    # Handle different section types; unknown sections fall back to raw JSON
+    _SECTION_DISPLAYS.get(section_name, _render_json)(section_data, key)
 
-def display_repository_info(info: Dict[str, Any]) -> None:
+def display_repository_info(info: Dict[str, Any], key: str) -> None:
     """Display repository information"""
     if not isinstance(info, dict):
-        st.json(info)
+        _render_json(info, key)
         return
     
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.metric("Name", info.get("name", "N/A"))
-        st.metric("Language", info.get("language", "N/A"))
-        st.metric("Stars", info.get("stars", 0))
-        st.metric("Forks", info.get("forks", 0))
-    
-    with col2:
-        st.metric("Watchers", info.get("watchers", 0))
-        st.metric("Open Issues", info.get("open_issues", 0))
-        st.metric("Size", f"{info.get('size', 0)} KB")
-        st.metric("License", info.get("license", "N/A"))
+    _metric_grid([
+        ("Name", info.get("name", "N/A")),
+        ("Language", info.get("language", "N/A")),
+        ("Stars", info.get("stars", 0)),
+        ("Forks", info.get("forks", 0)),
+        ("Watchers", info.get("watchers", 0)),
+        ("Open Issues", info.get("open_issues", 0)),
+        ("Size", f"{info.get('size', 0)} KB"),
+        ("License", info.get("license", "N/A"))
+    ], cols=4)
     
     if info.get("description"):
-        st.markdown("#### Description")
-        st.write(info["description"])
+        _render_text_section("#### Description", info["description"])
     
     if info.get("topics"):
-        st.markdown("#### Topics")
-        for topic in info["topics"]:
-            st.markdown(f"`{topic}`")
+        _render_text_section("#### Topics", " ".join(f"`{topic}`" for topic in info["topics"]))
 
-def display_file_structure(structure: Dict[str, Any]) -> None:
+def display_file_structure(structure: Dict[str, Any], key: str) -> None:
     """Display file structure"""
     if not isinstance(structure, dict):
-        st.json(structure)
+        _render_json(structure, key)
         return
     
-    if "directory_tree" in structure:
-        tree_data = structure["directory_tree"]
-        if isinstance(tree_data, dict) and "result" in tree_data:
-            st.markdown("#### Directory Tree")
-            st.code(tree_data["result"], language="text")
+    tree_data = _unwrap(structure.get("directory_tree"))
+    if tree_data is not None:
+        st.markdown("#### Directory Tree")
+        st.code(tree_data, language="text")
     
-    if "file_structure" in structure:
-        file_data = structure["file_structure"]
-        if isinstance(file_data, dict) and "result" in file_data:
-            st.markdown("#### File Structure")
-            st.json(file_data["result"])
+    file_data = _unwrap(structure.get("file_structure"))
+    if file_data is not None:
+        st.markdown("#### File Structure")
+        _render_json(file_data, f"{key}_file_structure")
 
-def display_code_metrics(metrics: Dict[str, Any]) -> None:
+def display_code_metrics(metrics: Dict[str, Any], key: str) -> None:
     """Display code metrics"""
     if not isinstance(metrics, dict):
-        st.json(metrics)
+        _render_json(metrics, key)
         return
     
-    if "metrics" in metrics:
-        metrics_data = metrics["metrics"]
-        if isinstance(metrics_data, dict) and "result" in metrics_data:
-            st.markdown("#### Code Metrics")
-            st.json(metrics_data["result"])
+    metrics_data = _unwrap(metrics.get("metrics"))
+    if metrics_data is not None:
+        st.markdown("#### Code Metrics")
+        _render_json(metrics_data, f"{key}_metrics")
     
     if "patterns" in metrics:
-        patterns_data = metrics["patterns"]
         st.markdown("#### Code Patterns")
-        for pattern_name, pattern_data in patterns_data.items():
-            if pattern_data and isinstance(pattern_data, dict) and pattern_data.get("result"):
-                st.markdown(f"**{pattern_name.replace('_', ' ').title()}**")
-                st.json(pattern_data["result"])
+        _render_results(metrics["patterns"], st.markdown, "**{title}**", f"{key}_patterns")
 
-def display_dependencies(dependencies: Dict[str, Any]) -> None:
+def display_dependencies(dependencies: Dict[str, Any], key: str) -> None:
     """Display dependencies"""
     if not isinstance(dependencies, dict):
-        st.json(dependencies)
+        _render_json(dependencies, key)
         return
     
     if "dependency_files" in dependencies:
-        files_data = dependencies["dependency_files"]
         st.markdown("#### Dependency Files")
-        for file_name, file_data in files_data.items():
-            if file_data and isinstance(file_data, dict) and file_data.get("result"):
-                st.markdown(f"**{file_name}**")
-                st.code(file_data["result"], language="text")
+        _render_results(dependencies["dependency_files"], st.markdown, "**{name}**", f"{key}_dependency_files",
+                        lambda content: st.code(content, language="text"))
 
-def display_commit_history(history: Dict[str, Any]) -> None:
+def display_commit_history(history: Dict[str, Any], key: str) -> None:
     """Display commit history"""
     if not isinstance(history, dict):
-        st.json(history)
+        _render_json(history, key)
         return
     
-    if "recent_commits" in history:
-        commits_data = history["recent_commits"]
-        if isinstance(commits_data, dict) and "result" in commits_data:
-            st.markdown("#### Recent Commits")
-            st.json(commits_data["result"])
+    commits_data = _unwrap(history.get("recent_commits"))
+    if commits_data is not None:
+        st.markdown("#### Recent Commits")
+        _render_json(commits_data, f"{key}_recent_commits")
 
-def display_security_data(security: Dict[str, Any]) -> None:
+def display_security_data(security: Dict[str, Any], key: str) -> None:
     """Display security data"""
     if not isinstance(security, dict):
-        st.json(security)
+        _render_json(security, key)
         return
     
     if "risk_level" in security:
         risk_level = security["risk_level"]
-        risk_color = {"low": "green", "medium": "orange", "high": "red"}.get(risk_level, "gray")
+        risk_color = _RISK_COLORS.get(risk_level, "gray")
         st.metric("🔒 Security Risk Level", risk_level.upper(), delta_color=risk_color)
     
     if "security_patterns" in security:
-        patterns = security["security_patterns"]
         st.markdown("#### Security Patterns")
-        for pattern_name, pattern_data in patterns.items():
-            if pattern_data and isinstance(pattern_data, dict) and pattern_data.get("result"):
-                st.warning(f"⚠️ {pattern_name.replace('_', ' ').title()}")
-                st.json(pattern_data["result"])
+        _render_results(security["security_patterns"], st.warning, "⚠️ {title}", f"{key}_security_patterns")
 
-def display_ai_summary(summary: Dict[str, Any]) -> None:
+def display_ai_summary(summary: Dict[str, Any], key: str) -> None:
     """Display AI summary"""
     if not isinstance(summary, dict):
-        st.json(summary)
+        _render_json(summary, key)
         return
     
     if "summary" in summary:
-        st.markdown("#### 🤖 AI Summary")
-        st.write(summary["summary"])
+        _render_text_section(_HDR_AI_SUMMARY, summary["summary"])
     
     if "tools_used" in summary:
-        st.markdown("#### 🔧 Tools Used")
-        for tool in summary["tools_used"]:
-            st.markdown(f"- {tool}")
+        tools = "\n".join(f"- {tool}" for tool in summary["tools_used"])
+        st.markdown(f"{_HDR_TOOLS_USED}\n\n{tools}")
+
+# Display function for each known analysis section
+_SECTION_DISPLAYS = {
+    "repository_info": display_repository_info,
+    "file_structure": display_file_structure,
+    "code_metrics": display_code_metrics,
+    "dependencies": display_dependencies,
+    "commit_history": display_commit_history,
+    "security": display_security_data,
+    "ai_summary": display_ai_summary
+}
+
+# Smart summary sections rendered by a plain display function: (key, header, renderer)
+_SMART_SUMMARY_SECTIONS = (
+    ("overview", "#### 📋 Project Overview", display_repository_info),
+    ("structure", "#### 🏗️ Architecture & Structure", display_file_structure),
+    ("metrics", _HDR_CODE_METRICS, display_code_metrics),
+    ("dependencies", "#### 📦 Dependencies", display_dependencies)
+)
 
 def display_analysis_entry(entry: Dict[str, Any]) -> None:
     """Display a single analysis history entry"""
-    st.markdown(f"**Type:** {entry['type']}")
-    st.markdown(f"**Timestamp:** {entry['timestamp']}")
+    lines = [f"**Type:** {entry['type']}", f"**Timestamp:** {entry['timestamp']}"]
     
     if "tools_used" in entry:
-        st.markdown("**Tools Used:**")
-        for tool in entry["tools_used"]:
-            st.markdown(f"- {tool}")
+        lines.append("**Tools Used:**\n" + "\n".join(f"- {tool}" for tool in entry["tools_used"]))
+    st.markdown("\n\n".join(lines))
     
     if "result" in entry:
         result = entry["result"]
@@ -1043,10 +1155,37 @@ def display_analysis_entry(entry: Dict[str, Any]) -> None:
                     st.markdown("**Summary:**")
                     st.write(ai_summary["summary"])
     
-    if st.button("View Full Results", key=f"view_{entry['timestamp']}"):
-        st.json(entry["result"])
+    # A checkbox rather than a button so the view survives the preview's "Load full data" rerun
+    if "result" in entry and st.checkbox("View Full Results", key=f"view_{entry['timestamp']}"):
+        _render_json(entry["result"], f"history_{entry['timestamp']}")
+
+# Charts shown by the visualizations tab: (section key, icon, chart name)
+_VISUALIZATION_CHARTS = (
+    ("directory_tree", "📁", "directory tree"),
+    ("file_structure", "📊", "file structure"),
+    ("dependency_graph", "🔗", "dependency graph"),
+    ("language_distribution", "🌐", "language distribution"),
+    ("code_heatmap", "📈", "activity heatmap")
+)
 
-def display_visualization_results(result: Dict[str, Any]) -> None:
+@st.cache_resource(max_entries=32, show_spinner=False)
+def _figure_from_json(data: str) -> Any:
+    """Deserialize a Plotly figure once per distinct JSON payload"""
+    # Imported here so pages that never show a chart don't pay for loading Plotly;
+    # cache_resource hands back the same Figure instead of a copy per rerun
+    import plotly.graph_objects as go
+    return go.Figure.from_json(data)
+
+def _chart_figure(key: str, data: str) -> Optional[Any]:
+    """Deserialize a chart's figure, or return None if it can't be rendered"""
+    try:
+        return _figure_from_json(data)
+    except (ValueError, KeyError, TypeError) as e:
+        # json.JSONDecodeError and Plotly's validation errors are both ValueErrors
+        logger.warning("Could not render %s figure", key, exc_info=e)
+        return None
+
+def display_visualization_results(result: Dict[str, Any], key: str) -> None:
     """Display visualization results with enhanced error handling"""
     if "error" in result:
         st.error(f"❌ Visualization generation failed: {result['error']}")
@@ -1055,36 +1194,7 @@ def display_visualization_results(result: Dict[str, Any]) -> None:
     st.success(f"✅ Visualizations generated in {result.get('duration', 0):.2f} seconds")
     
     # Display tool utilization
-    if "tools_used" in result and result["tools_used"]:
-        st.markdown("#### 🔧 Tools Used")
-        tools_used = result["tools_used"]
-        
-        # Group tools by server
-        server_tools = {}
-        for tool in tools_used:
-            if '.' in tool:
-                server, tool_name = tool.split('.', 1)
-                if server not in server_tools:
-                    server_tools[server] = []
-                server_tools[server].append(tool_name)
-            else:
-                if 'unknown' not in server_tools:
-                    server_tools['unknown'] = []
-                server_tools['unknown'].append(tool)
-        
-        # Display grouped by server
-        for server, tools in server_tools.items():
-            server_icon = {
-                'file_content': '📄',
-                'repository_structure': '📁',
-                'commit_history': '📝',
-                'code_search': '🔍',
-                'unknown': '❓'
-            }.get(server, '🔧')
-            
-            st.markdown(f"**{server_icon} {server.replace('_', ' ').title()} Server:**")
-            st.write(f"  - {', '.join(tools)}")
-            st.markdown("")
+    _render_tools_used(result.get("tools_used"))
     
     # Display sections
     sections = result.get("sections", {})
@@ -1092,176 +1202,113 @@ def display_visualization_results(result: Dict[str, Any]) -> None:
     if "visualizations" in sections:
         viz_data = sections["visualizations"]
         if isinstance(viz_data, dict):
-            # Directory Tree
-            if "directory_tree" in viz_data and viz_data["directory_tree"]:
-                st.markdown("#### 📁 Directory Tree")
-                tree_viz = viz_data["directory_tree"]
-                if isinstance(tree_viz, dict) and "data" in tree_viz:
-                    try:
-                        fig = go.Figure.from_json(tree_viz["data"])
-                        st.plotly_chart(fig, use_container_width=True)
-                    except Exception as e:
-                        st.warning(f"⚠️ Could not display directory tree: {str(e)}")
-                        st.info("Directory tree data is available but cannot be rendered as a chart.")
-                else:
-                    st.info("📁 Directory tree data collected successfully")
-            else:
-                st.info("📁 Directory tree data not available")
-            
-            # File Structure
-            if "file_structure" in viz_data and viz_data["file_structure"]:
-                st.markdown("#### 📊 File Structure")
-                structure_viz = viz_data["file_structure"]
-                if isinstance(structure_viz, dict) and "data" in structure_viz:
-                    try:
-                        fig = go.Figure.from_json(structure_viz["data"])
-                        st.plotly_chart(fig, use_container_width=True)
-                    except Exception as e:
-                        st.warning(f"⚠️ Could not display file structure: {str(e)}")
-                        st.info("File structure data is available but cannot be rendered as a chart.")
-                else:
-                    st.info("📊 File structure data collected successfully")
-            else:
-                st.info("📊 File structure data not available")
-            
-            # Dependency Graph
-            if "dependency_graph" in viz_data and viz_data["dependency_graph"]:
-                st.markdown("#### 🔗 Dependency Graph")
-                dep_viz = viz_data["dependency_graph"]
-                if isinstance(dep_viz, dict) and "data" in dep_viz:
-                    try:
-                        fig = go.Figure.from_json(dep_viz["data"])
-                        st.plotly_chart(fig, use_container_width=True)
-                    except Exception as e:
-                        st.warning(f"⚠️ Could not display dependency graph: {str(e)}")
-                        st.info("Dependency data is available but cannot be rendered as a chart.")
-                else:
-                    st.info("🔗 Dependency data collected successfully")
-            else:
-                st.info("🔗 Dependency graph data not available")
-            
-            # Language Distribution
-            if "language_distribution" in viz_data and viz_data["language_distribution"]:
-                st.markdown("#### 🌐 Language Distribution")
-                lang_viz = viz_data["language_distribution"]
-                if isinstance(lang_viz, dict) and "data" in lang_viz:
-                    try:
-                        fig = go.Figure.from_json(lang_viz["data"])
-                        st.plotly_chart(fig, use_container_width=True)
-                    except Exception as e:
-                        st.warning(f"⚠️ Could not display language distribution: {str(e)}")
-                        st.info("Language data is available but cannot be rendered as a chart.")
-                else:
-                    st.info("🌐 Language distribution data collected successfully")
-            else:
-                st.info("🌐 Language distribution data not available")
-            
-            # Activity Heatmap
-            if "code_heatmap" in viz_data and viz_data["code_heatmap"]:
-                st.markdown("#### 📈 Activity Heatmap")
-                heatmap_viz = viz_data["code_heatmap"]
-                if isinstance(heatmap_viz, dict) and "data" in heatmap_viz:
-                    try:
-                        fig = go.Figure.from_json(heatmap_viz["data"])
-                        st.plotly_chart(fig, use_container_width=True)
-                    except Exception as e:
-                        st.warning(f"⚠️ Could not display activity heatmap: {str(e)}")
-                        st.info("Activity data is available but cannot be rendered as a chart.")
-                else:
-                    st.info("📈 Activity heatmap data collected successfully")
-            else:
-                st.info("📈 Activity heatmap data not available")
+            for chart_key, icon, chart_name in _VISUALIZATION_CHARTS:
+                chart = viz_data.get(chart_key)
+                if not chart:
+                    st.info(f"{icon} {chart_name.capitalize()} data not available")
+                    continue
+                
+                if not (isinstance(chart, dict) and "data" in chart):
+                    with st.container():
+                        st.markdown(f"#### {icon} {chart_name.title()}")
+                        st.info(f"{icon} {chart_name.capitalize()} data collected successfully")
+                    continue
+                
+                # Only emit the header once the figure is known to render
+                fig = _chart_figure(chart_key, chart["data"])
+                if fig is None:
+                    st.info(f"{icon} {chart_name.capitalize()} is available but cannot be rendered as a chart.")
+                    continue
+                with st.container():
+                    st.markdown(f"#### {icon} {chart_name.title()}")
+                    st.plotly_chart(fig, use_container_width=True)
     else:
         st.warning("⚠️ No visualization data found in the results")
         st.info("The analysis completed but no visualization sections were generated.")
 
-def display_smart_summary_results(result: Dict[str, Any]) -> None:
+def display_smart_summary_results(result: Dict[str, Any], key: str) -> None:
     """Display smart summarization results"""
     if "error" in result:
         st.error(f"❌ Smart summarization failed: {result['error']}")
         return
     
+    _render_smart_summary(result, key)
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _prepare_summary_model(fingerprint: Tuple[int, Any], _result: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the smart summary's markdown once per result instead of on every rerun"""
+    # The result dict itself isn't hashed: it lives unchanged in session_state, so its
+    # identity plus duration is enough to tell one summary from the next
+    sections = _result.get("sections", {})
+    model = {
+        "tools_md": _tools_used_markdown(tuple(_result["tools_used"])) if _result.get("tools_used") else None,
+        "ai_summary_md": None,
+        "ai_tools_md": None,
+        "patterns": None,
+    }
+    
+    ai_summary = sections.get("ai_summary")
+    if isinstance(ai_summary, dict) and "summary" in ai_summary:
+        model["ai_summary_md"] = ai_summary["summary"]
+        if "tools_used" in ai_summary:
+            lines = [_HDR_ANALYSIS_TOOLS_USED]
+            tools = ai_summary["tools_used"]
+            if isinstance(tools, list):
+                lines.append("\n".join(f"- {tool}" for tool in tools))
+            model["ai_tools_md"] = "\n\n".join(lines)
+    
+    patterns = sections.get("patterns")
+    if patterns is not None:
+        model["patterns"] = []
+        if isinstance(patterns, dict) and "code_patterns" in patterns:
+            for pattern_type, pattern_data in patterns["code_patterns"].items():
+                preview = None
+                if isinstance(pattern_data, dict) and "result" in pattern_data:
+                    # Convert to text once and reuse it for both the length check and the preview
+                    text = pattern_data["result"]
+                    if not isinstance(text, str):
+                        text = str(text)
+                    preview = text[:300] + "..." if len(text) > 300 else text
+                model["patterns"].append((f"**{pattern_type.title()}:**", preview))
+    
+    return model
+
+@_fragment
+def _render_smart_summary(result: Dict[str, Any], key: str) -> None:
+    """Render a successful smart summary; widgets inside it only rerun this fragment"""
     st.success(f"✅ Smart summarization completed in {result.get('duration', 0):.2f} seconds")
     
+    model = _prepare_summary_model((id(result), result.get("duration")), result)
+    
     # Display tool utilization
-    if "tools_used" in result and result["tools_used"]:
-        st.markdown("#### 🔧 Tools Used")
-        tools_used = result["tools_used"]
-        
-        # Group tools by server
-        server_tools = {}
-        for tool in tools_used:
-            if '.' in tool:
-                server, tool_name = tool.split('.', 1)
-                if server not in server_tools:
-                    server_tools[server] = []
-                server_tools[server].append(tool_name)
-            else:
-                if 'unknown' not in server_tools:
-                    server_tools['unknown'] = []
-                server_tools['unknown'].append(tool)
-        
-        # Display grouped by server
-        for server, tools in server_tools.items():
-            server_icon = {
-                'file_content': '📄',
-                'repository_structure': '📁',
-                'commit_history': '📝',
-                'code_search': '🔍',
-                'unknown': '❓'
-            }.get(server, '🔧')
-            
-            st.markdown(f"**{server_icon} {server.replace('_', ' ').title()} Server:**")
-            st.write(f"  - {', '.join(tools)}")
-            st.markdown("")
+    if model["tools_md"]:
+        st.markdown(model["tools_md"])
     
     # Display sections
     sections = result.get("sections", {})
     
     # AI Summary (comprehensive)
-    if "ai_summary" in sections:
-        ai_summary = sections["ai_summary"]
-        if isinstance(ai_summary, dict) and "summary" in ai_summary:
-            st.markdown("#### 🧠 AI-Powered Comprehensive Summary")
-            st.markdown(ai_summary["summary"])
-            
-            # Tools used
-            if "tools_used" in ai_summary:
-                st.markdown("**🔧 Analysis Tools Used:**")
-                tools = ai_summary["tools_used"]
-                if isinstance(tools, list):
-                    for tool in tools:
-                        st.write(f"• {tool}")
-    
-    # Overview
-    if "overview" in sections:
-        st.markdown("#### 📋 Project Overview")
-        display_repository_info(sections["overview"])
-    
-    # Structure
-    if "structure" in sections:
-        st.markdown("#### 🏗️ Architecture & Structure")
-        display_file_structure(sections["structure"])
-    
-    # Metrics
-    if "metrics" in sections:
-        st.markdown("#### 📊 Code Metrics")
-        display_code_metrics(sections["metrics"])
-    
-    # Dependencies
-    if "dependencies" in sections:
-        st.markdown("#### 📦 Dependencies")
-        display_dependencies(sections["dependencies"])
+    if model["ai_summary_md"] is not None:
+        # Header, summary and its tool list go out as one markdown element
+        parts = [_HDR_COMPREHENSIVE_SUMMARY, str(model["ai_summary_md"])]
+        if model["ai_tools_md"]:
+            parts.append(model["ai_tools_md"])
+        st.markdown("\n\n".join(parts))
+    
+    # Overview, structure, metrics and dependencies
+    for section, header, renderer in _SMART_SUMMARY_SECTIONS:
+        data = sections.get(section)
+        if data is not None:
+            st.markdown(header)
+            renderer(data, f"{key}_{section}")
     
     # Patterns
-    if "patterns" in sections:
-        st.markdown("#### 🔍 Code Patterns")
-        patterns = sections["patterns"]
-        if isinstance(patterns, dict) and "code_patterns" in patterns:
-            for pattern_type, pattern_data in patterns["code_patterns"].items():
-                st.write(f"**{pattern_type.title()}:**")
-                if isinstance(pattern_data, dict) and "result" in pattern_data:
-                    st.code(pattern_data["result"][:300] + "..." if len(str(pattern_data["result"])) > 300 else pattern_data["result"])
+    if model["patterns"] is not None:
+        st.markdown(_HDR_CODE_PATTERNS)
+        for title, preview in model["patterns"]:
+            st.write(title)
+            if preview is not None:
+                st.code(preview)
 
 def render_enhanced_progress_display(progress_data: Dict[str, Any]) -> None:
     """Render enhanced progress display with stage-based progress bars"""
@@ -1329,25 +1376,71 @@ def render_enhanced_progress_display(progress_data: Dict[str, Any]) -> None:
                     st.progress(stage_progress / 100.0)
                 
                 # Stage details
-                col1, col2, col3 = st.columns(3)
-                with col1:
-                    st.metric("Progress", f"{stage_progress:.1f}%")
-                with col2:
-                    if total_tools > 0:
-                        completed_count = len(tools_completed)
-                        st.metric("Tools", f"{completed_count}/{total_tools}")
-                    else:
-                        st.metric("Status", stage_status.title())
-                with col3:
-                    if current_tool and stage_status == "running":
-                        st.metric("Current Tool", current_tool.replace("_", " ").title())
-                    else:
-                        st.metric("Status", stage_status.title())
+                status_metric = ("Status", stage_status.title())
+                _metric_grid([
+                    ("Progress", f"{stage_progress:.1f}%"),
+                    ("Tools", f"{len(tools_completed)}/{total_tools}") if total_tools > 0 else status_metric,
+                    ("Current Tool", current_tool.replace("_", " ").title())
+                    if current_tool and stage_status == "running" else status_metric
+                ])
                 
                 # Show completed tools if any
                 if tools_completed:
                     with st.expander(f"Completed tools ({len(tools_completed)})", expanded=False):
-                        for tool in tools_completed:
-                            st.markdown(f"• {tool.replace('_', ' ').title()}")
+                        st.markdown("\n".join(f"- {tool.replace('_', ' ').title()}" for tool in tools_completed))
                 
-                st.markdown("---") 
\ No newline at end of file
+                st.markdown("---")
+
+# Tabs that only need options, a button and a display function are described by data
+_SIMPLE_ANALYSIS_SPECS = {
+    "security": {
+        "key": "security",
+        "title": "#### 🔒 Security Analysis",
+        "description": "Analyze security aspects and potential vulnerabilities.",
+        "options": (
+            ("Check Dependency Vulnerabilities", "Check Security Patterns"),
+            ("Check for Hardcoded Credentials", "Check File Permissions")
+        ),
+        "button": "🔒 Start Security Analysis",
+        "spinner": "🔒 Performing security analysis...",
+        "display": display_security_analysis_results
+    },
+    "code_quality": {
+        "key": "code_quality",
+        "title": "#### 📊 Code Quality Analysis",
+        "description": "Analyze code quality, patterns, and best practices.",
+        "options": (
+            ("Analyze Code Patterns", "Check Documentation"),
+            ("Analyze Testing", "Check Code Metrics")
+        ),
+        "button": "📊 Start Code Quality Analysis",
+        "spinner": "📊 Performing code quality analysis...",
+        "display": display_code_quality_results
+    },
+    "visualizations": {
+        "key": "visualizations",
+        "title": "#### 🗺️ Repository Visualizations",
+        "description": "Generate interactive visualizations and repository maps.",
+        "options": (
+            ("Directory Tree", "File Structure", "Dependency Graph"),
+            ("Activity Heatmap", "Language Distribution", "File Size Distribution")
+        ),
+        "button": "🗺️ Generate Visualizations",
+        "spinner": "🗺️ Generating visualizations...",
+        "display": display_visualization_results
+    }
+}
+
+# Analysis views in display order: label -> renderer
+_ANALYSIS_TABS = {
+    "🚀 Quick Overview": render_quick_analysis_tab,
+    "🔍 Comprehensive": render_comprehensive_analysis_tab,
+    "🔒 Security": functools.partial(render_simple_analysis_tab, _SIMPLE_ANALYSIS_SPECS["security"]),
+    "📊 Code Quality": functools.partial(render_simple_analysis_tab, _SIMPLE_ANALYSIS_SPECS["code_quality"]),
+    "🗺️ Visualizations": functools.partial(render_simple_analysis_tab, _SIMPLE_ANALYSIS_SPECS["visualizations"]),
+    "🧠 Smart Summary": render_smart_summary_tab,
+    "📈 History": render_analysis_history_tab
+}
+
+# Radio options for the tab selector, in display order
+_ANALYSIS_TAB_LABELS = tuple(_ANALYSIS_TABS)
@@ -3,11 +3,19 @@ GitHub Repository Q&A Chat Interface (Enhanced)
 Clean chat interface with enhanced visual appeal and better UX
 """
 
+import html
 import streamlit as st
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, Optional
 import time
 
+from src.agent.ai_agent import (
+    ask_repository_question,
+    ask_repository_question_smart,
+    generate_repository_chart_data,
+)
+from src.servers.server_manager import SERVER_ICONS, get_servers_status
+
 # --- Quick Questions - Enhanced set ---
 QUICK_QUESTIONS = [
     ("🏠 What is this repo about?", "What is this repository about and what does it do?"),
@@ -121,11 +129,12 @@ def render_chat_interface(repo_url: Optional[str] = None) -> None:
         # Button row with enhanced styling
         col1, col2, col3, col4 = st.columns([2, 1, 1, 1])
         with col1:
-            submit_button = st.form_submit_button("🤖 Ask AI Agent", type="primary", use_container_width=True)
+            submit_button = st.form_submit_button("🤖 Ask AI Agent", type="primary", use_container_width=True,
+                                                  on_click=_mark_submitted)
         with col2:
-            summarize_button = st.form_submit_button("📊 Summarize", use_container_width=True)
+            summarize_button = st.form_submit_button("📊 Summarize", use_container_width=True, on_click=_mark_submitted)
         with col3:
-            chart_button = st.form_submit_button("📈 Chart Data", use_container_width=True)
+            chart_button = st.form_submit_button("📈 Chart Data", use_container_width=True, on_click=_mark_submitted)
         with col4:
             clear_button = st.form_submit_button("🗑️ Clear", use_container_width=True)
     
@@ -133,21 +142,18 @@ def render_chat_interface(repo_url: Optional[str] = None) -> None:
     if submit_button and question.strip():
         process_question(question, repo_url, "chat", speed_option)
         st.session_state.question_input = ""
-        st.rerun()
     elif submit_button and not question.strip():
         st.warning("⚠️ Please enter a question.")
     
     if summarize_button and question.strip():
         process_question(question, repo_url, "summarize", speed_option)
         st.session_state.question_input = ""
-        st.rerun()
     elif summarize_button and not question.strip():
         st.warning("⚠️ Please enter a question for summarization.")
     
     if chart_button and question.strip():
         process_question(question, repo_url, "chart", speed_option)
         st.session_state.question_input = ""
-        st.rerun()
     elif chart_button and not question.strip():
         st.warning("⚠️ Please enter a question for chart data generation.")
     
@@ -158,9 +164,17 @@ def render_chat_interface(repo_url: Optional[str] = None) -> None:
     # --- Display Chat History ---
     display_chat_history()
 
+def _mark_submitted() -> None:
+    """Form submit callback; marks one pending question for process_question to consume"""
+    st.session_state.question_submitted = True
+
 # --- Process Question with enhanced spinners ---
 def process_question(question: str, repo_url: str, mode: str = "chat", speed_mode: str = "⚡ Fast Mode (30s)") -> None:
     """Process a question and get AI response with enhanced progress tracking and tool status updates"""
+    # Each submit click answers once; a repeat call without a new click is a duplicate trigger
+    if not st.session_state.pop("question_submitted", False):
+        return
+
     st.session_state.chat_history.append({
         "role": "user",
         "content": question,
@@ -179,9 +193,6 @@ def process_question(question: str, repo_url: str, mode: str = "chat", speed_mod
         status_text = st.empty()
         
         try:
-            from src.agent.ai_agent import ask_repository_question
-            from src.servers.server_manager import get_servers_status
-            
             # Get server status for tracking
             server_status = get_servers_status()
             active_servers = [name for name, info in server_status["servers"].items() if info["running"]]
@@ -217,13 +228,11 @@ def process_question(question: str, repo_url: str, mode: str = "chat", speed_mod
                 if "Fast Mode" in speed_mode:
                     speed_mode = "fast"
                     if mode == "chart":
-                        from src.agent.ai_agent import generate_repository_chart_data
                         response, tools_used = generate_repository_chart_data(repo_url, status_callback=status_callback)
                     else:
                         response, tools_used = ask_repository_question(question, repo_url, status_callback=status_callback, speed_mode=speed_mode)
                 elif "Smart Mode" in speed_mode:
                     # Use smart analysis with selected analysis type
-                    from src.agent.ai_agent import ask_repository_question_smart, generate_repository_chart_data
                     if mode == "chart":
                         response, tools_used = generate_repository_chart_data(repo_url, status_callback=status_callback)
                     else:
@@ -231,7 +240,6 @@ def process_question(question: str, repo_url: str, mode: str = "chat", speed_mod
                 else:
                     speed_mode = "standard"
                     if mode == "chart":
-                        from src.agent.ai_agent import generate_repository_chart_data
                         response, tools_used = generate_repository_chart_data(repo_url, status_callback=status_callback)
                     else:
                         response, tools_used = ask_repository_question(question, repo_url, status_callback=status_callback, speed_mode=speed_mode)
@@ -316,70 +324,55 @@ def display_chat_history() -> None:
     # Enhanced message display
     st.markdown("#### 💭 Conversation History")
     
-    for i, message in enumerate(st.session_state.chat_history):
-        if message["role"] == "user":
-            with st.chat_message("user"):
-                st.write(f"**{message['content']}**")
-                st.caption(f"📅 {format_timestamp(message['timestamp'])}")
-                if message.get("mode") == "summarize":
-                    st.info("📊 Summarization request")
-        else:
-            with st.chat_message("assistant"):
-                # Enhanced response with green highlights
-                response_content = message["content"]
-                if message.get("mode") == "summarize":
-                    response_content = f"📊 **Summary:**\n\n{response_content}"
-                
-                # Apply green highlighting for better visibility
-                st.markdown(f"""
-                <div style="background-color: #f0f9ff; border-left: 4px solid #10b981; padding: 1rem; border-radius: 8px; margin: 0.5rem 0;">
-                    {response_content}
-                </div>
-                """, unsafe_allow_html=True)
-                
-                st.caption(f"📅 {format_timestamp(message['timestamp'])}")
-                
-                # Enhanced tool and server usage display
-                if message.get("tools_used") and st.session_state.get("show_tool_usage", True):
-                    st.markdown("**🔧 Analysis Tools Used:**")
-                    # Group tools by server
-                    server_tools = {}
-                    for tool in message["tools_used"]:
-                        if '.' in tool:
-                            server, tool_name = tool.split('.', 1)
-                            if server not in server_tools:
-                                server_tools[server] = []
-                            server_tools[server].append(tool_name)
-                        else:
-                            if 'unknown' not in server_tools:
-                                server_tools['unknown'] = []
-                            server_tools['unknown'].append(tool)
-                    
-                    # Display grouped by server
-                    for server, tools in server_tools.items():
-                        server_icon = {
-                            'file_content': '📄',
-                            'repository_structure': '📁',
-                            'commit_history': '📝',
-                            'code_search': '🔍',
-                            'unknown': '❓'
-                        }.get(server, '🔧')
-                        
-                        st.markdown(f"**{server_icon} {server.replace('_', ' ').title()} Server:**")
-                        for tool in tools:
-                            st.write(f"  - {tool}")
-                        st.markdown("")
-                
-                if message.get("servers_used"):
-                    st.markdown("**🖥️ Active MCP Servers:**")
-                    for server in message["servers_used"]:
-                        server_icon = {
-                            'file_content': '📄',
-                            'repository_structure': '📁',
-                            'commit_history': '📝',
-                            'code_search': '🔍'
-                        }.get(server, '🖥️')
-                        st.write(f"• {server_icon} {server.replace('_', ' ').title()}")
+    # One markdown element per message instead of one per line of its body
+    for message in st.session_state.chat_history:
+        with st.chat_message(message["role"]):
+            st.markdown(_message_markdown(message), unsafe_allow_html=True)
+
+def _message_markdown(message: Dict[str, Any]) -> str:
+    """Build the body of a chat message as a single markdown block"""
+    timestamp = f"<small>📅 {format_timestamp(message['timestamp'])}</small>"
+    if message["role"] == "user":
+        # User text is shown verbatim, so escape anything that looks like HTML
+        parts = [f"**{html.escape(message['content'])}**", timestamp]
+        if message.get("mode") == "summarize":
+            parts.append("📊 *Summarization request*")
+        return "\n\n".join(parts)
+
+    response_content = message["content"]
+    if message.get("mode") == "summarize":
+        response_content = f"📊 **Summary:**\n\n{response_content}"
+
+    # Blank lines keep the response parsed as markdown inside the highlight box
+    parts = [
+        '<div style="background-color: #f0f9ff; border-left: 4px solid #10b981; padding: 1rem; border-radius: 8px; margin: 0.5rem 0;">'
+        f"\n\n{response_content}\n\n</div>",
+        timestamp,
+    ]
+
+    if message.get("tools_used") and st.session_state.get("show_tool_usage", True):
+        parts.append("**🔧 Analysis Tools Used:**")
+        # Group tools by server
+        server_tools = {}
+        for tool in message["tools_used"]:
+            server, sep, tool_name = tool.partition('.')
+            if not sep:
+                server, tool_name = 'unknown', tool
+            server_tools.setdefault(server, []).append(tool_name)
+
+        for server, tools in server_tools.items():
+            server_icon = SERVER_ICONS.get(server, '🔧')
+            tool_lines = "\n".join(f"- {tool}" for tool in tools)
+            parts.append(f"**{server_icon} {server.replace('_', ' ').title()} Server:**\n{tool_lines}")
+
+    if message.get("servers_used"):
+        server_lines = "\n".join(
+            f"- {SERVER_ICONS.get(server, '🖥️')} {server.replace('_', ' ').title()}"
+            for server in message["servers_used"]
+        )
+        parts.append(f"**🖥️ Active MCP Servers:**\n{server_lines}")
+
+    return "\n\n".join(parts)
 
 def format_timestamp(timestamp: str) -> str:
     """Format timestamp for display"""
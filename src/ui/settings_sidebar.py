@@ -6,7 +6,7 @@ Provides streamlined interface for application settings and server management
 import streamlit as st
 import os
 from src.utils.config import get_groq_api_key, has_required_keys
-from src.servers.server_manager import get_servers_status, start_mcp_servers, stop_mcp_servers, restart_mcp_servers
+from src.servers.server_manager import get_servers_status, start_mcp_servers, stop_mcp_servers, restart_mcp_servers, SERVER_ICONS
 
 def render_settings_sidebar():
     """Render the enhanced settings sidebar with system status"""
@@ -43,12 +43,7 @@ def render_settings_sidebar():
         # Server status details
         st.markdown("#### 📊 Server Details")
         for server_name, server_info in server_status['servers'].items():
-            server_icon = {
-                'file_content': '📄',
-                'repository_structure': '📁',
-                'commit_history': '📝',
-                'code_search': '🔍'
-            }.get(server_name, '🖥️')
+            server_icon = SERVER_ICONS.get(server_name, '🖥️')
             
             status_icon = "✅" if server_info['running'] else "❌"
             status_color = "green" if server_info['running'] else "red"
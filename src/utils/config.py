@@ -145,21 +145,23 @@ def save_ui_settings(settings: Dict[str, Any]):
     for key, value in settings.items():
         st.session_state[key] = value
 
+# Defaults for analysis settings not overridden in session state
+ANALYSIS_SETTING_DEFAULTS = {
+    "max_file_size": 1024 * 1024,  # 1MB
+    "max_files_per_analysis": 100,
+    "include_hidden_files": False,
+    "analysis_timeout": 300,  # 5 minutes
+    "enable_code_metrics": True,
+    "enable_security_analysis": True,
+    "enable_dependency_analysis": True,
+    "enable_commit_analysis": True,
+    "enable_structure_analysis": True
+}
+
 def get_analysis_settings():
     """Get analysis-specific settings"""
-    defaults = {
-        "max_file_size": 1024 * 1024,  # 1MB
-        "max_files_per_analysis": 100,
-        "include_hidden_files": False,
-        "analysis_timeout": 300,  # 5 minutes
-        "enable_code_metrics": True,
-        "enable_security_analysis": True,
-        "enable_dependency_analysis": True,
-        "enable_commit_analysis": True,
-        "enable_structure_analysis": True
-    }
-    
-    return {key: st.session_state.get(key, default) for key, default in defaults.items()}
+    # Not cached: the values come from the current session's state
+    return {key: st.session_state.get(key, default) for key, default in ANALYSIS_SETTING_DEFAULTS.items()}
 
 def save_analysis_settings(settings: Dict[str, Any]):
     """Save analysis settings to session state"""
@@ -251,43 +253,46 @@ def get_system_info() -> Dict[str, Any]:
         "temp_directory": str(Path("tmp").absolute())
     }
 
+# Predefined analysis presets; built once and shared read-only by every caller
+ANALYSIS_PRESETS = {
+    "quick": {
+        "name": "Quick Overview",
+        "description": "Fast analysis with basic insights",
+        "max_files": 20,
+        "max_depth": 2,
+        "include_metrics": False,
+        "include_security": False,
+        "timeout": 60
+    },
+    "standard": {
+        "name": "Standard Analysis",
+        "description": "Comprehensive analysis with metrics",
+        "max_files": 50,
+        "max_depth": 3,
+        "include_metrics": True,
+        "include_security": True,
+        "timeout": 180
+    },
+    "deep": {
+        "name": "Deep Analysis",
+        "description": "In-depth analysis with all features",
+        "max_files": 100,
+        "max_depth": 5,
+        "include_metrics": True,
+        "include_security": True,
+        "timeout": 300
+    },
+    "security": {
+        "name": "Security Focus",
+        "description": "Security-focused analysis",
+        "max_files": 75,
+        "max_depth": 4,
+        "include_metrics": True,
+        "include_security": True,
+        "timeout": 240
+    }
+}
+
 def get_analysis_presets() -> Dict[str, Dict[str, Any]]:
     """Get predefined analysis presets"""
-    return {
-        "quick": {
-            "name": "Quick Overview",
-            "description": "Fast analysis with basic insights",
-            "max_files": 20,
-            "max_depth": 2,
-            "include_metrics": False,
-            "include_security": False,
-            "timeout": 60
-        },
-        "standard": {
-            "name": "Standard Analysis",
-            "description": "Comprehensive analysis with metrics",
-            "max_files": 50,
-            "max_depth": 3,
-            "include_metrics": True,
-            "include_security": True,
-            "timeout": 180
-        },
-        "deep": {
-            "name": "Deep Analysis",
-            "description": "In-depth analysis with all features",
-            "max_files": 100,
-            "max_depth": 5,
-            "include_metrics": True,
-            "include_security": True,
-            "timeout": 300
-        },
-        "security": {
-            "name": "Security Focus",
-            "description": "Security-focused analysis",
-            "max_files": 75,
-            "max_depth": 4,
-            "include_metrics": True,
-            "include_security": True,
-            "timeout": 240
-        }
-    } 
\ No newline at end of file
+    return ANALYSIS_PRESETS
@@ -693,11 +693,10 @@ class PerformanceMonitor:
     
     def _update_server_usage(self, tool_name: str):
         """Update server usage tracking"""
-        if '.' in tool_name:
-            server_name = tool_name.split('.')[0]
-            if server_name not in self.current_analysis["server_usage"]:
-                self.current_analysis["server_usage"][server_name] = 0
-            self.current_analysis["server_usage"][server_name] += 1
+        server_name, sep, _ = tool_name.partition('.')
+        if sep:
+            server_usage = self.current_analysis["server_usage"]
+            server_usage[server_name] = server_usage.get(server_name, 0) + 1
     
     def _format_duration(self, seconds: float) -> str:
         """Format duration in human-readable format"""
@@ -10,16 +10,12 @@ import sys
 import os
 import time
 
+PYTHON_EXE = sys.executable
+
 def start_server(script_path, server_name):
     print(f"Starting {server_name}...")
     try:
-        process = subprocess.Popen([sys.executable, script_path])
-        time.sleep(1)
-        if process.poll() is None:
-            print(f"Started {server_name} (PID: {process.pid})")
-            return process
-        else:
-            print(f"Failed to start {server_name}")
+        return subprocess.Popen([PYTHON_EXE, script_path])
     except Exception as e:
         print(f"Error: {e}")
 
@@ -30,13 +26,23 @@ def main():
         ("src/servers/commit_history_server.py", "Commit History Server"),
         ("src/servers/code_search_server.py", "Code Search Server"),
     ]
-    processes = []
+    launched = []
     for script, name in servers:
         if os.path.exists(script):
             proc = start_server(script, name)
-            if proc: processes.append((proc, name))
+            if proc: launched.append((proc, name))
         else:
             print(f"File not found: {script}")
+    # Give every server the same startup window instead of one second each
+    if launched:
+        time.sleep(1)
+    processes = []
+    for proc, name in launched:
+        if proc.poll() is None:
+            print(f"Started {name} (PID: {proc.pid})")
+            processes.append((proc, name))
+        else:
+            print(f"Failed to start {name}")
     if not processes:
         print("No servers started.")
         return
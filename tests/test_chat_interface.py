@@ -0,0 +1,55 @@
+"""
+Tests for the chat interface's duplicate-submit guard
+"""
+
+from unittest import mock
+
+import pytest
+
+pytest.importorskip("streamlit")
+pytest.importorskip("agno")
+
+from src.ui import chat_interface
+
+
+class _SessionState(dict):
+    """Dict with attribute access, standing in for st.session_state"""
+
+    def __getattr__(self, name):
+        try:
+            return self[name]
+        except KeyError as e:
+            raise AttributeError(name) from e
+
+    __setattr__ = dict.__setitem__
+
+
+@pytest.fixture
+def fake_st(monkeypatch):
+    """Replace streamlit and the agent calls so process_question runs offline"""
+    st = mock.MagicMock()
+    st.session_state = _SessionState(chat_history=[], processing=False)
+    monkeypatch.setattr(chat_interface, "st", st)
+    monkeypatch.setattr(chat_interface.time, "sleep", lambda _: None)
+    monkeypatch.setattr(chat_interface, "get_servers_status", lambda: {"servers": {}})
+    monkeypatch.setattr(chat_interface, "ask_repository_question",
+                        mock.Mock(return_value=("answer", ["github_repo.get_repository_info"])))
+    return st
+
+
+def test_same_submit_twice_adds_one_exchange(fake_st):
+    chat_interface._mark_submitted()
+    chat_interface.process_question("What is this repo?", "https://github.com/o/r")
+    chat_interface.process_question("What is this repo?", "https://github.com/o/r")
+
+    history = fake_st.session_state.chat_history
+    assert [m["role"] for m in history] == ["user", "assistant"]
+    assert chat_interface.ask_repository_question.call_count == 1
+
+
+def test_each_new_submit_is_answered(fake_st):
+    for _ in range(2):
+        chat_interface._mark_submitted()
+        chat_interface.process_question("What is this repo?", "https://github.com/o/r")
+
+    assert len(fake_st.session_state.chat_history) == 4